@@ -1,16 +1,19 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
 import time
 import altair as alt
 import random
 
 from grid import GridMap
-from dijkstra import dijkstra
-from astar import astar
-from dp_path import dp_shortest_path
+from planner import run_planner, select_engine
 from dstar_lite import DStarLite
+from bidirectional import bidirectional_dijkstra, bidirectional_astar
+from landmarks import load_or_build
+from route_cache import RouteCache
+from instrument import Stats
+from stream import STREAM_ALGOS, SteppedSearch
+from render import render_rgb
 
 from sort_algorithms import merge_sort, quick_sort
 
@@ -36,6 +39,8 @@ if "gridmap" not in st.session_state:
     st.session_state.gridmap = None
 if "path" not in st.session_state:
     st.session_state.path = None
+if "visited" not in st.session_state:
+    st.session_state.visited = None
 if "runs" not in st.session_state:
     st.session_state.runs = []
 if "dstar" not in st.session_state:
@@ -46,26 +51,45 @@ if "sort_results" not in st.session_state:
     st.session_state.sort_results = None
 
 # =================================================
-# GRID DRAW
+# CACHES
 # =================================================
-def draw_grid(gridmap, path=None):
-    fig, ax = plt.subplots(figsize=(4, 4))
-    ax.imshow(gridmap.grid, cmap="binary")
+@st.cache_data(max_entries=32)
+def load_grid(n, obs, seed):
+    """
+    (n, engel oranı, seed) başına bir kez üretilir. cache_data her çağrıda
+    ayrı bir kopya döner; D* Lite'ın grid üzerindeki değişiklikleri
+    önbelleğe sızmaz.
+    """
+    gm = GridMap(n, obs, seed)
+    gm.generate()
+    gm.component_index()
+    return gm
+
+
+@st.cache_resource
+def shared_route_cache():
+    """
+    Rerun'lar ve oturumlar arasında paylaşılan rota önbelleği; anahtar
+    grid fingerprint + algoritma + parametreler (route_cache.RouteCache).
+    """
+    return RouteCache(maxsize=256)
 
-    r0, c0 = gridmap.start
-    r1, c1 = gridmap.goal
-    ax.scatter(c0, r0, c="green", s=60)
-    ax.scatter(c1, r1, c="red", s=60)
 
-    if path:
-        xs = [c for (r, c) in path]
-        ys = [r for (r, c) in path]
-        ax.plot(xs, ys, c="blue", linewidth=2)
+# =================================================
+# GRID DRAW
+# =================================================
+# görüntünün ekrandaki yaklaşık kenar uzunluğu (piksel)
+DISPLAY_PX = 400
 
-    ax.invert_yaxis()
-    ax.set_title("Grid Haritası")
-    ax.axis("off")
-    st.pyplot(fig)
+
+def draw_grid(gridmap, path=None, visited=None):
+    img = render_rgb(gridmap.grid, path, visited, gridmap.start, gridmap.goal,
+                     max_size=DISPLAY_PX)
+    # küçük gridler tarayıcıda bulanık ölçeklenmesin diye tam sayı katla büyütülür
+    scale = max(DISPLAY_PX // max(img.shape[:2]), 1)
+    img = img.repeat(scale, axis=0).repeat(scale, axis=1)
+    # satır 0 altta (önceki imshow + invert_yaxis görünümü)
+    st.image(img[::-1], caption="Grid Haritası")
 
 # =================================================
 # TAB 1 — SENİN KODUN (SADECE GRID KÜÇÜK)
@@ -75,19 +99,22 @@ with tab1:
 
     n = st.sidebar.slider("Grid boyutu (n x n)", 10, 80, 30, step=2)
     obs = st.sidebar.slider("Engel oranı", 0.0, 0.6, 0.22, step=0.02)
+    seed = st.sidebar.number_input("Seed", min_value=0, max_value=10**6, value=42, step=1)
 
     st.sidebar.markdown("---")
 
     algo = st.sidebar.radio(
         "Algoritma Seç",
-        ["Dijkstra", "A*", "DP", "D* Lite"]
+        ["Dijkstra", "A*", "DP", "D* Lite", "Bidirectional Dijkstra", "Bidirectional A*"]
     )
 
     heuristic = st.sidebar.selectbox(
         "A* sezgisi",
-        ["manhattan", "euclidean", "chebyshev"]
+        ["manhattan", "euclidean", "chebyshev", "alt"]
     )
 
+    live = st.sidebar.checkbox("Aramayı adım adım izle", value=False)
+
     st.sidebar.markdown("---")
     btn_generate = st.sidebar.button("🧱 Grid Oluştur / Yenile")
     btn_run = st.sidebar.button("🏃‍♂️ Algoritmayı Çalıştır")
@@ -95,10 +122,9 @@ with tab1:
     btn_clear_runs = st.sidebar.button("🗑 Tüm Run Sonuçlarını Temizle")
 
     if btn_generate:
-        gm = GridMap(n, obs)
-        gm.generate()
-        st.session_state.gridmap = gm
+        st.session_state.gridmap = load_grid(n, obs, int(seed))
         st.session_state.path = None
+        st.session_state.visited = None
         st.session_state.dstar = None
         st.success("Yeni grid oluşturuldu")
 
@@ -107,49 +133,164 @@ with tab1:
     with col_left:
         st.subheader("🗺 Grid ve Rota")
 
-        if st.session_state.gridmap:
-            draw_grid(st.session_state.gridmap, st.session_state.path)
-        else:
-            st.info("Önce grid oluştur")
-
         if btn_run and st.session_state.gridmap:
             gm = st.session_state.gridmap
 
-            if algo == "Dijkstra":
-                path, cost, expanded, runtime, _ = dijkstra(gm.grid, gm.start, gm.goal)
-            elif algo == "A*":
-                path, cost, expanded, runtime, _ = astar(
-                    gm.grid, gm.start, gm.goal, heuristic
-                )
-            elif algo == "DP":
-                path, cost, expanded, runtime, _ = dp_shortest_path(
-                    gm.grid, gm.start, gm.goal
-                )
+            planner_algo = {"Dijkstra": "dijkstra", "A*": "astar", "DP": "dp"}.get(algo)
+            cache = shared_route_cache()
+            cached = None
+            # canlı izleme: stream.SteppedSearch motor seçmez ve sayaç bildirmez
+            live_run = (live and planner_algo in STREAM_ALGOS
+                        and gm.component_index().connected(gm.start, gm.goal))
+
+            def compute():
+                stats = Stats()
+                sides = (None, None)  # çift yönlü aramada (ileri, geri) genişletme
+                # ALT landmark tabloları grid başına bir kez hesaplanıp diskte
+                # tutulur; sezgiyi yalnızca A* türevleri kullanır
+                landmarks = None
+                if heuristic == "alt" and algo in ("A*", "Bidirectional A*"):
+                    landmarks = load_or_build(gm.grid)
+
+                if algo == "Bidirectional Dijkstra":
+                    path, cost, expanded, runtime, visited, sides = bidirectional_dijkstra(
+                        gm.grid, gm.start, gm.goal, stats, trace="order"
+                    )
+                elif algo == "Bidirectional A*":
+                    path, cost, expanded, runtime, visited, sides = bidirectional_astar(
+                        gm.grid, gm.start, gm.goal, heuristic, landmarks, stats, trace="order"
+                    )
+                elif live_run:
+                    # genişletme batch'leri geldikçe ilerleme çubuğu güncellenir
+                    params = {"trace": "order"}
+                    if planner_algo == "astar":
+                        params.update(heuristic=heuristic, landmarks=landmarks)
+                    search = SteppedSearch(planner_algo, gm.grid, gm.start, gm.goal,
+                                           batch_size=max(gm.grid.size // 50, 1), **params)
+                    free = max(int(np.count_nonzero(gm.grid == 0)), 1)
+                    bar = st.progress(0.0)
+                    for step in search:
+                        bar.progress(min(step.total_expanded / free, 1.0),
+                                     text=f"{step.total_expanded} hücre genişletildi")
+                    bar.empty()
+                    path, cost, expanded, runtime, visited = search.result
+                    return path, cost, expanded, runtime, sides, {}, visited
+                else:
+                    path, cost, expanded, runtime, visited = run_planner(
+                        planner_algo, gm.grid, gm.start, gm.goal, heuristic,
+                        landmarks=landmarks, components=gm.component_index(),
+                        stats=stats, trace="order"
+                    )
+                return path, cost, expanded, runtime, sides, stats.as_dict(), visited
+
+            if algo == "Bidirectional Dijkstra":
+                engine = "bidijkstra"
+            elif algo == "Bidirectional A*":
+                engine = "biastar"
+            elif live_run:
+                engine = planner_algo  # örn. dijkstra birim maliyette de heap ile çalışır
+            elif planner_algo:
+                engine = select_engine(planner_algo)
             else:
+                engine = "dstar"
+
+            if engine == "dstar":
+                sides = (None, None)
+                stats = Stats()
                 if st.session_state.dstar is None:
                     st.session_state.dstar = DStarLite(
-                        gm.grid, gm.start, gm.goal
+                        gm.grid, gm.start, gm.goal, components=gm.component_index()
                     )
-                path, cost, expanded, runtime, _ = st.session_state.dstar.find_path()
+                path, cost, expanded, runtime, _ = st.session_state.dstar.find_path(stats)
+                counters = stats.as_dict()
+                visited = None
+            elif live_run:
+                # sayaçsız sonuç önbelleğe yazılmaz (sonraki normal çalıştırma
+                # onu isabet olarak alırdı)
+                path, cost, expanded, runtime, sides, counters, visited = compute()
+                cached = False
+            else:
+                # sezgi yalnızca A* türevlerinin sonucunu etkiler
+                params = {"heuristic": heuristic} if engine in ("astar", "biastar") else {}
+                result, cached = cache.fetch(gm.grid, gm.start, gm.goal, engine,
+                                             compute, params)
+                path, cost, expanded, runtime, sides, counters, visited = result
 
             if path:
                 st.session_state.path = path
+                st.session_state.visited = visited
                 st.session_state.runs.append({
                     "algo": algo,
+                    "engine": engine,
                     "time_ms": round(runtime * 1000, 3),
                     "expanded": expanded,
-                    "cost": cost
+                    "expanded_fwd": sides[0],
+                    "expanded_bwd": sides[1],
+                    "cost": cost,
+                    "cached": cached,
+                    **counters
                 })
-                draw_grid(gm, path)
             else:
                 st.warning("Yol bulunamadı")
 
+        if btn_dynamic and st.session_state.gridmap:
+            gm = st.session_state.gridmap
+            if st.session_state.dstar is None:
+                st.session_state.dstar = DStarLite(
+                    gm.grid, gm.start, gm.goal, components=gm.component_index()
+                )
+                st.session_state.dstar.find_path()
+            dstar = st.session_state.dstar
+
+            # start / goal dışında rastgele bir hücre engel <-> boş
+            rng = np.random.default_rng()
+            while True:
+                r, c = (int(v) for v in rng.integers(0, gm.n, size=2))
+                if (r, c) not in (gm.start, gm.goal):
+                    break
+            old = int(gm.grid[r, c])
+
+            # D* Lite grid'i kendisi günceller (gm.grid ile aynı dizi) ve
+            # yalnızca etkilenen düğümleri yeniden planlar
+            stats = Stats()
+            updated = dstar.update_cell((r, c), 1 - old, stats)
+            path, cost, expanded, runtime, _ = dstar.find_path(stats)
+            runtime += stats.phases.get("update", 0.0)
+
+            st.session_state.path = path
+            st.session_state.visited = None
+            st.session_state.runs.append({
+                "algo": "D* Lite (update)",
+                "engine": "dstar",
+                "time_ms": round(runtime * 1000, 3),
+                "expanded": updated + expanded,
+                "expanded_fwd": None,
+                "expanded_bwd": None,
+                "cost": cost,
+                "cached": False,
+                **stats.as_dict()
+            })
+            st.info(f"Hücre ({r},{c}) {old} -> {1 - old}")
+            if not path:
+                st.warning("Yol bulunamadı")
+
+        # çalıştırmadan sonra tek çizim
+        if st.session_state.gridmap:
+            draw_grid(st.session_state.gridmap, st.session_state.path,
+                      st.session_state.visited)
+        else:
+            st.info("Önce grid oluştur")
+
     with col_right:
         st.subheader("📊 Run Sonuçları")
 
         if btn_clear_runs:
             st.session_state.runs = []
 
+        cache = shared_route_cache()
+        st.caption(f"Rota önbelleği (paylaşılan): {cache.hits} isabet / {cache.misses} ıska "
+                   f"({len(cache)}/{cache.maxsize} kayıt)")
+
         if st.session_state.runs:
             df = pd.DataFrame(st.session_state.runs)
             st.dataframe(df, use_container_width=True)
@@ -2,7 +2,11 @@ import heapq
 import time
 import math
 
-def heuristic_fn(a, b, mode="manhattan"):
+def heuristic_fn(a, b, mode="manhattan", landmarks=None):
+    if mode == "alt":
+        # landmarks: landmarks.LandmarkTable
+        return landmarks.heuristic(a, b)
+
     (r1, c1) = a
     (r2, c2) = b
     dr = abs(r1 - r2)
@@ -17,9 +21,12 @@ def heuristic_fn(a, b, mode="manhattan"):
 
     return dr + dc
 
-def astar(grid, start, goal, heuristic="manhattan"):
+def astar(grid, start, goal, heuristic="manhattan", landmarks=None):
     t0 = time.perf_counter()
 
+    if heuristic == "alt" and landmarks is None:
+        raise ValueError("heuristic='alt' requires a landmark table")
+
     rows, cols = grid.shape
     INF = float("inf")
 
@@ -28,7 +35,7 @@ def astar(grid, start, goal, heuristic="manhattan"):
     visited = set()
     expanded = 0
 
-    pq = [(heuristic_fn(start, goal, heuristic), 0, start)]  # (f, g, node)
+    pq = [(heuristic_fn(start, goal, heuristic, landmarks), 0, start)]  # (f, g, node)
 
     while pq:
         f, gcur, u = heapq.heappop(pq)
@@ -50,7 +57,7 @@ def astar(grid, start, goal, heuristic="manhattan"):
                 if tentative < g.get(v, INF):
                     g[v] = tentative
                     prev[v] = u
-                    fv = tentative + heuristic_fn(v, goal, heuristic)
+                    fv = tentative + heuristic_fn(v, goal, heuristic, landmarks)
                     heapq.heappush(pq, (fv, tentative, v))
 
     path = []
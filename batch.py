@@ -0,0 +1,98 @@
+"""
+Çoklu sorgu (batch) rota API'si.
+
+Aynı grid üzerinde binlerce (start, goal) çiftini bir süreç havuzunda
+çözer. Grid, padded uint8 haliyle bir kez multiprocessing.shared_memory
+bloğuna yazılır; işçiler bu bloğa bağlanıp kopyasız FlatGrid kurar, yani
+grid görev başına pickle'lanmaz. Sonuçlar sorgu sırasıyla döner.
+
+    results, stats = route_batch(gm.grid, [((0, 0), (9, 9)), ...], algo="astar")
+    stats["queries_per_sec"]
+"""
+
+import os
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from flat_search import FlatGrid
+from planner import run_planner
+
+# FlatGrid'i doğrudan kabul eden algoritmalar; dp için ndarray görünümü verilir
+FLAT_ALGOS = {"dijkstra", "astar", "bidijkstra", "biastar", "jps"}
+
+_worker = {}  # işçi süreç başına durum (shared memory, grid görünümleri, parametreler)
+
+
+def _attach(blocked, rows, cols, algo, heuristic, landmarks):
+    fg = FlatGrid.from_buffer(blocked, rows, cols)
+    _worker["grid"] = fg if algo in FLAT_ALGOS else fg.padded_array()[1:-1, 1:-1]
+    _worker["params"] = (algo, heuristic, landmarks)
+
+
+def _init_worker(shm_name, rows, cols, algo, heuristic, landmarks):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm  # referans tutulmazsa blok kapanır
+    # bazı sistemlerde blok sayfa boyutuna yuvarlanır; fazlası kullanılmaz
+    _attach(shm.buf[:(rows + 2) * (cols + 2)], rows, cols, algo, heuristic, landmarks)
+
+
+def _solve(query):
+    start, goal = query
+    algo, heuristic, landmarks = _worker["params"]
+    # visited yalnızca görselleştirme içindir; batch yolunda iz tutulmaz
+    path, cost, expanded, _, _ = run_planner(
+        algo, _worker["grid"], start, goal, heuristic, landmarks=landmarks, trace="none"
+    )
+    return path, cost, expanded
+
+
+def route_batch(grid, queries, algo="astar", heuristic="manhattan", workers=None,
+                chunksize=None, landmarks=None):
+    """
+    grid: numpy array (0 boş, 1 engel)
+    queries: [(start, goal), ...] ya da (Q, 2, 2) tamsayı dizisi
+    workers: süreç sayısı (None → os.cpu_count(); 0/1 → aynı süreçte)
+    chunksize: işçiye tek seferde verilen sorgu sayısı (None → otomatik)
+
+    Returns:
+        results: [(path, cost, expanded), ...] sorgu sırasıyla
+        stats: {"queries", "workers", "chunksize", "elapsed", "queries_per_sec"}
+    """
+    queries = [(tuple(int(x) for x in s), tuple(int(x) for x in g)) for s, g in queries]
+    workers = (os.cpu_count() or 1) if workers is None else int(workers)
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+
+    t0 = time.perf_counter()
+
+    if workers <= 1:
+        fg = FlatGrid(grid)
+        _attach(fg.blocked, rows, cols, algo, heuristic, landmarks)
+        results = [_solve(q) for q in queries]
+        chunksize = len(queries)
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(queries) // (workers * 4))
+
+        padded = FlatGrid(grid).padded_array()
+        shm = shared_memory.SharedMemory(create=True, size=padded.nbytes)
+        try:
+            np.ndarray(padded.shape, dtype=np.uint8, buffer=shm.buf)[:] = padded
+            with Pool(workers, initializer=_init_worker,
+                      initargs=(shm.name, rows, cols, algo, heuristic, landmarks)) as pool:
+                results = pool.map(_solve, queries, chunksize=chunksize)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    elapsed = time.perf_counter() - t0
+    stats = {
+        "queries": len(queries),
+        "workers": max(workers, 1),
+        "chunksize": chunksize,
+        "elapsed": elapsed,
+        "queries_per_sec": len(queries) / elapsed if elapsed > 0 else float("inf"),
+    }
+    return results, stats
@@ -0,0 +1,44 @@
+"""
+route_batch verimi (queries/sec): işçi sayısı ve chunk boyutuna göre.
+
+    python bench_batch.py --n 300 --queries 2000 --workers 1 2 4 8
+"""
+
+import argparse
+
+import numpy as np
+
+from grid import GridMap
+from batch import route_batch
+
+
+def run(n, obstacle_ratio, n_queries, algo, workers_list, chunksize, seed):
+    gm = GridMap(n, obstacle_ratio, seed)
+    gm.generate()
+
+    rng = np.random.default_rng(seed)
+    free = np.argwhere(gm.grid == 0)
+    queries = [(free[rng.integers(len(free))], free[rng.integers(len(free))])
+               for _ in range(n_queries)]
+
+    print(f"n={n} obstacle_ratio={obstacle_ratio} algo={algo} queries={n_queries}")
+    print(f"{'workers':>8} {'chunk':>6} {'elapsed_s':>10} {'queries/s':>10}")
+    for w in workers_list:
+        _, stats = route_batch(gm.grid, queries, algo, workers=w, chunksize=chunksize)
+        print(f"{stats['workers']:>8} {stats['chunksize']:>6} "
+              f"{stats['elapsed']:>10.2f} {stats['queries_per_sec']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=300)
+    parser.add_argument("--obstacle-ratio", type=float, default=0.2)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--algo", default="astar")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunksize", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    run(args.n, args.obstacle_ratio, args.queries, args.algo, args.workers,
+        args.chunksize, args.seed)
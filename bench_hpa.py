@@ -0,0 +1,69 @@
+"""
+HPA* ölçümü: kurulum süresi, sorgu gecikmesi ve yol uzunluğu sapması.
+
+Her grid için HPAStar bir kez kurulur, rastgele (start, goal) çiftleri
+hem HPA* hem astar_flat ile çözülür. Ayrıca rastgele hücre değişiminde
+update_cell süresi ölçülür.
+
+    python bench_hpa.py --sizes 200 500 --cluster 16 --queries 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from grid import GridMap
+from flat_search import astar_flat
+from hpa import HPAStar
+
+
+def run(sizes, obstacle_ratio, cluster_size, queries, seed):
+    print(f"{'n':>6} {'build_s':>8} {'hpa_ms':>8} {'astar_ms':>9} "
+          f"{'subopt_avg':>10} {'subopt_max':>10} {'update_ms':>9}")
+
+    for n in sizes:
+        gm = GridMap(n, obstacle_ratio, seed)
+        gm.generate()
+        hpa = HPAStar(gm.grid.copy(), cluster_size)
+
+        rng = np.random.default_rng(seed)
+        free = np.argwhere(gm.grid == 0)
+        t_hpa, t_astar, ratios = [], [], []
+
+        for _ in range(queries):
+            s = tuple(int(x) for x in free[rng.integers(len(free))])
+            g = tuple(int(x) for x in free[rng.integers(len(free))])
+
+            _, c_hpa, _, rt_hpa, _ = hpa.find_path(s, g)
+            _, c_opt, _, rt_astar, _ = astar_flat(gm.grid, s, g)
+            if c_opt is None:
+                continue
+
+            t_hpa.append(rt_hpa)
+            t_astar.append(rt_astar)
+            if c_opt > 0:
+                ratios.append(c_hpa / c_opt)
+
+        t_update = []
+        for _ in range(20):
+            cell = tuple(int(x) for x in rng.integers(0, n, 2))
+            t0 = time.perf_counter()
+            hpa.update_cell(cell, 1 - int(hpa.grid[cell]))
+            t_update.append(time.perf_counter() - t0)
+
+        print(f"{n:>6} {hpa.build_time:>8.2f} {np.mean(t_hpa)*1000:>8.2f} "
+              f"{np.mean(t_astar)*1000:>9.2f} {np.mean(ratios):>10.4f} "
+              f"{np.max(ratios):>10.4f} {np.mean(t_update)*1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 500])
+    parser.add_argument("--obstacle-ratio", type=float, default=0.2)
+    parser.add_argument("--cluster", type=int, default=16)
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    run(args.sizes, args.obstacle_ratio, args.cluster, args.queries, args.seed)
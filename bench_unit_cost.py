@@ -0,0 +1,57 @@
+"""
+Birim maliyetli motorlar (BFS / Dial) ile heap tabanlı Dijkstra karşılaştırması.
+
+GridMap üreticisiyle farklı boyut ve engel oranlarında köşeden köşeye
+sorgu çalıştırır, maliyetlerin aynı olduğunu kontrol eder ve süreleri
+tablo olarak yazar. Dial için 1..max_weight arası rastgele hücre
+maliyetleri kullanılır ve ağırlıklı heap Dijkstra ile karşılaştırılır.
+
+    python bench_unit_cost.py --sizes 100 250 500 --ratios 0.0 0.2 0.4
+"""
+
+import argparse
+
+import numpy as np
+
+from grid import GridMap
+from dijkstra import dijkstra
+from flat_search import dijkstra_flat
+from bucket_search import bfs_shortest_path, dial_shortest_path
+
+
+def run(sizes, ratios, seeds, max_weight):
+    header = (f"{'n':>6} {'obs':>5} {'seed':>5} | {'dijkstra':>9} {'dijk_flat':>9} "
+              f"{'bfs':>9} | {'dijk_w':>9} {'dial':>9}   (ms)")
+    print(header)
+    print("-" * len(header))
+
+    for n in sizes:
+        for obs in ratios:
+            for seed in seeds:
+                gm = GridMap(n, obs, seed)
+                gm.generate()
+                s, g = gm.start, gm.goal
+
+                _, c_heap, _, t_heap, _ = dijkstra(gm.grid, s, g)
+                _, c_flat, _, t_flat, _ = dijkstra_flat(gm.grid, s, g)
+                _, c_bfs, _, t_bfs, _ = bfs_shortest_path(gm.grid, s, g)
+                assert c_heap == c_flat == c_bfs, (n, obs, seed)
+
+                weights = np.random.default_rng(seed).integers(1, max_weight + 1, size=(n, n))
+                _, c_w, _, t_w, _ = dijkstra_flat(gm.grid, s, g, weights)
+                _, c_dial, _, t_dial, _ = dial_shortest_path(gm.grid, s, g, weights)
+                assert c_w == c_dial, (n, obs, seed)
+
+                print(f"{n:>6} {obs:>5.2f} {seed:>5} | {t_heap*1000:>9.1f} {t_flat*1000:>9.1f} "
+                      f"{t_bfs*1000:>9.1f} | {t_w*1000:>9.1f} {t_dial*1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 250, 500])
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.0, 0.1, 0.2, 0.3])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[42])
+    parser.add_argument("--max-weight", type=int, default=9)
+    args = parser.parse_args()
+
+    run(args.sizes, args.ratios, args.seeds, args.max_weight)
@@ -0,0 +1,176 @@
+"""
+Tüm planlayıcılar için arayüzsüz (headless) benchmark.
+
+Grid boyutu, engel oranı, seed, algoritma ve sezgi kombinasyonlarını
+tarar. Her kombinasyon önce warm-up turlarıyla ısıtılır, sonra repeats
+kez ölçülür; median / p95 süre, genişletilen düğüm sayısı ve (ayrı bir
+tracemalloc turunda) tepe bellek kaydedilir. Sonuçlar CSV / JSON olarak
+yazılabilir. streamlit / tkinter / matplotlib import edilmez.
+
+    python benchmark.py --sizes 50 100 200 --ratios 0.1 0.3 --seeds 1 2 3 \\
+        --algos dijkstra astar jps dstar --heuristics manhattan alt \\
+        --repeats 5 --csv results.csv --json results.json
+"""
+
+import argparse
+import csv
+import json
+import time
+import tracemalloc
+
+import numpy as np
+
+from grid import GridMap
+from planner import ALGORITHMS, run_planner, select_engine
+from dstar_lite import DStarLite
+from landmarks import build_landmarks
+from flat_search import TRACE_MODES
+
+BENCH_ALGOS = ALGORITHMS + ["dstar"]
+
+# sezgi yalnızca bu algoritmaların sonucunu etkiler
+HEURISTIC_ALGOS = {"astar", "biastar"}
+
+FIELDS = ["n", "obstacle_ratio", "seed", "algo", "engine", "heuristic", "repeats",
+          "median_ms", "p95_ms", "min_ms", "expanded", "cost", "peak_kb"]
+
+
+def _solve(algo, gm, heuristic, landmarks, trace):
+    if algo == "dstar":
+        # D* Lite durum tuttuğu için her ölçümde sıfırdan kurulur
+        planner = DStarLite(gm.grid, gm.start, gm.goal)
+        return planner.find_path()
+    return run_planner(algo, gm.grid, gm.start, gm.goal, heuristic, landmarks=landmarks,
+                       trace=trace)
+
+
+def measure(algo, gm, heuristic="manhattan", landmarks=None, warmup=1, repeats=5,
+            trace="visited"):
+    """
+    trace: planlayıcıya verilen visited biçimi (flat_search.TRACE_MODES)
+
+    Returns: {"times", "expanded", "cost", "peak_kb"}
+        times: repeats adet duvar saati süresi (s)
+    """
+    for _ in range(warmup):
+        _solve(algo, gm, heuristic, landmarks, trace)
+
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        _, cost, expanded, _, _ = _solve(algo, gm, heuristic, landmarks, trace)
+        times.append(time.perf_counter() - t0)
+
+    # tracemalloc süreyi bozduğundan bellek ayrı bir turda ölçülür
+    tracemalloc.start()
+    try:
+        _solve(algo, gm, heuristic, landmarks, trace)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # dp maliyeti float döner; diğerleriyle karşılaştırılabilsin
+    cost = None if cost is None else int(cost)
+    return {"times": times, "expanded": expanded, "cost": cost, "peak_kb": peak / 1024}
+
+
+def run(sizes, ratios, seeds, algos, heuristics, warmup=1, repeats=5,
+        ensure_path=False, verbose=True, trace="visited"):
+    """
+    Returns: FIELDS anahtarlı satır dict'lerinin listesi
+    """
+    for algo in algos:
+        if algo not in BENCH_ALGOS:
+            raise ValueError(f"Unknown algorithm: {algo}")
+
+    rows = []
+    if verbose:
+        print(f"{'n':>5} {'obs':>5} {'seed':>5} {'algo':>10} {'heur':>9} | "
+              f"{'median_ms':>10} {'p95_ms':>9} {'expanded':>9} {'cost':>6} {'peak_kb':>9}")
+
+    for n in sizes:
+        for obs in ratios:
+            for seed in seeds:
+                gm = GridMap(n, obs, seed)
+                gm.generate(ensure_path=ensure_path)
+
+                # ALT tablosu grid başına bir kez, ölçüm dışında kurulur
+                landmarks = build_landmarks(gm.grid) if "alt" in heuristics else None
+                costs = set()
+
+                for algo in algos:
+                    algo_heuristics = heuristics if algo in HEURISTIC_ALGOS else ["-"]
+                    for heuristic in algo_heuristics:
+                        h = "manhattan" if heuristic == "-" else heuristic
+                        m = measure(algo, gm, h, landmarks if h == "alt" else None,
+                                    warmup, repeats, trace)
+
+                        times_ms = np.array(m["times"]) * 1000
+                        row = {
+                            "n": n,
+                            "obstacle_ratio": obs,
+                            "seed": seed,
+                            "algo": algo,
+                            "engine": select_engine(algo) if algo in ALGORITHMS else algo,
+                            "heuristic": heuristic,
+                            "repeats": repeats,
+                            "median_ms": round(float(np.median(times_ms)), 4),
+                            "p95_ms": round(float(np.percentile(times_ms, 95)), 4),
+                            "min_ms": round(float(times_ms.min()), 4),
+                            "expanded": m["expanded"],
+                            "cost": m["cost"],
+                            "peak_kb": round(m["peak_kb"], 1),
+                        }
+                        rows.append(row)
+                        costs.add(m["cost"])
+
+                        if verbose:
+                            print(f"{n:>5} {obs:>5.2f} {seed:>5} {algo:>10} {heuristic:>9} | "
+                                  f"{row['median_ms']:>10.3f} {row['p95_ms']:>9.3f} "
+                                  f"{row['expanded']:>9} {str(row['cost']):>6} "
+                                  f"{row['peak_kb']:>9.1f}")
+
+                # tüm planlayıcılar optimal; farklı maliyet bir hataya işaret eder
+                if len(costs) > 1 and verbose:
+                    print(f"WARNING: cost mismatch for n={n} obs={obs} seed={seed}: {costs}")
+
+    return rows
+
+
+def write_csv(rows, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, path):
+    with open(path, "w") as f:
+        json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.1, 0.2, 0.3])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[42])
+    parser.add_argument("--algos", nargs="+", default=BENCH_ALGOS, choices=BENCH_ALGOS)
+    parser.add_argument("--heuristics", nargs="+", default=["manhattan"],
+                        choices=["manhattan", "euclidean", "chebyshev", "alt"])
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--ensure-path", action="store_true",
+                        help="start/goal bağlı olacak şekilde grid üret")
+    parser.add_argument("--trace", default="visited", choices=TRACE_MODES,
+                        help="visited biçimi; 'none' iz maliyetini dışarıda bırakır")
+    parser.add_argument("--csv", default=None)
+    parser.add_argument("--json", default=None)
+    args = parser.parse_args()
+
+    rows = run(args.sizes, args.ratios, args.seeds, args.algos, args.heuristics,
+               args.warmup, args.repeats, args.ensure_path, trace=args.trace)
+
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.json:
+        write_json(rows, args.json)
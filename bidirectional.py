@@ -0,0 +1,184 @@
+"""
+Çift yönlü (bidirectional) Dijkstra ve A*.
+
+Aramalar start'tan ve goal'dan aynı anda ilerler; her adımda open listesi
+küçük olan taraf genişletilir. Bir taraf, diğer tarafın etiketlediği bir
+hücreye kenar gevşettiğinde en iyi birleşme maliyeti mu güncellenir.
+
+Durma kriterleri:
+    Dijkstra: top_f + top_b >= mu
+    A*      : top_f >= mu veya top_b >= mu   (tutarlı sezgiler için)
+
+Sonuç tuple'ı diğer planlayıcılarla aynı, ek olarak taraf başına
+genişletme sayısı döner:
+    path, cost, expanded, runtime, visited, (expanded_fwd, expanded_bwd)
+"""
+
+import heapq
+import time
+from array import array
+
+import numpy as np
+
+from flat_search import INF, as_flat, check_trace, _make_heuristic, _trace_result
+from instrument import lazy_heap_counts
+
+
+def _bidirectional(fg, s, g, hf=None, hb=None, stats=None, order=None):
+    t0 = time.perf_counter()
+    blocked = fg.blocked
+    offsets = fg.offsets
+    astar_mode = hf is not None
+
+    dist = (array("i", [INF]) * fg.size, array("i", [INF]) * fg.size)
+    prev = (array("i", [-1]) * fg.size, array("i", [-1]) * fg.size)
+    closed = (bytearray(fg.size), bytearray(fg.size))
+    heur = (hf, hb)
+    expanded = [0, 0]
+
+    dist[0][s] = 0
+    dist[1][g] = 0
+    # engelli uçtan başlayan taraf engelin içinde biten bir "yol" bulurdu
+    reachable = not (blocked[s] or blocked[g])
+    pqs = ([(hf(s) if astar_mode else 0, 0, s)],
+           [(hb(g) if astar_mode else 0, 0, g)]) if reachable else ([], [])
+
+    mu = INF
+    meet = -1
+    if s == g and reachable:
+        mu = 0
+        meet = s
+
+    push = heapq.heappush
+    pop = heapq.heappop
+    pushes = peak = 2 if reachable else 0
+    reopenings = 0
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+
+    while pqs[0] and pqs[1]:
+        top_f = pqs[0][0][0]
+        top_b = pqs[1][0][0]
+        if astar_mode:
+            if top_f >= mu or top_b >= mu:
+                break
+        elif top_f + top_b >= mu:
+            break
+
+        side = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+        pq = pqs[side]
+        d, d_other = dist[side], dist[1 - side]
+        p, cl, h = prev[side], closed[side], heur[side]
+
+        _, cost, u = pop(pq)
+        if cl[u]:
+            continue
+
+        cl[u] = 1
+        expanded[side] += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(fg.cell(u))
+
+        new_cost = cost + 1
+        for off in offsets:
+            v = u + off
+            if blocked[v]:
+                continue
+
+            if new_cost < d[v]:
+                d[v] = new_cost
+                p[v] = u
+                push(pq, (new_cost + h(v) if astar_mode else new_cost, new_cost, v))
+                pushes += 1
+                if cl[v]:
+                    reopenings += 1
+
+            if d_other[v] < INF and d[v] + d_other[v] < mu:
+                mu = d[v] + d_other[v]
+                meet = v
+
+        if instrumented and len(pqs[0]) + len(pqs[1]) > peak:
+            peak = len(pqs[0]) + len(pqs[1])
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if meet >= 0:
+        # start -> meet (ileri zincir), meet -> goal (geri zincir)
+        cur = meet
+        while cur != s:
+            path.append(fg.cell(cur))
+            cur = prev[0][cur]
+        path.append(fg.cell(s))
+        path.reverse()
+
+        cur = meet
+        while cur != g:
+            cur = prev[1][cur]
+            path.append(fg.cell(cur))
+        cost = mu
+
+    visited_mask = (np.frombuffer(closed[0], dtype=np.uint8) |
+                    np.frombuffer(closed[1], dtype=np.uint8))
+
+    if stats is not None:
+        left = len(pqs[0]) + len(pqs[1])
+        stats.record(**lazy_heap_counts(pushes, left, expanded[0] + expanded[1], peak,
+                                        reopenings, roots=2 if reachable else 0))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", time.perf_counter() - t_search)
+    return path, cost, expanded, visited_mask
+
+
+def _finish(fg, path, cost, sides, mask, order, trace, t0, stats):
+    t_cells = time.perf_counter()
+    visited = _trace_result(fg, trace, mask, order)
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.add_time("extract", t0 + runtime - t_cells)
+    return path, cost, sides[0] + sides[1], runtime, visited, tuple(sides)
+
+
+def bidirectional_dijkstra(grid, start, goal, stats=None, trace="visited"):
+    """
+    grid: numpy array (0 boş, 1 engel) ya da FlatGrid
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (flat_search.TRACE_MODES); "order" iki tarafın
+           genişletmelerini gerçekleştiği sırayla birlikte verir
+    Returns: path, cost, expanded, runtime, visited, (expanded_fwd, expanded_bwd)
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = as_flat(grid)
+    path, cost, sides, mask = _bidirectional(fg, fg.index(start), fg.index(goal),
+                                             stats=stats, order=order)
+
+    return _finish(fg, path, cost, sides, mask, order, trace, t0, stats)
+
+
+def bidirectional_astar(grid, start, goal, heuristic="manhattan", landmarks=None,
+                        stats=None, trace="visited"):
+    """
+    İleri arama goal'a, geri arama start'a doğru aynı sezgiyi kullanır.
+    landmarks: heuristic="alt" için landmarks.LandmarkTable
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (flat_search.TRACE_MODES)
+
+    Returns: path, cost, expanded, runtime, visited, (expanded_fwd, expanded_bwd)
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = as_flat(grid)
+    hf = _make_heuristic(fg, goal, heuristic, landmarks)
+    hb = _make_heuristic(fg, start, heuristic, landmarks)
+    path, cost, sides, mask = _bidirectional(fg, fg.index(start), fg.index(goal), hf, hb,
+                                             stats, order)
+
+    return _finish(fg, path, cost, sides, mask, order, trace, t0, stats)
@@ -0,0 +1,199 @@
+"""
+Birim / küçük tamsayı maliyetli grid'ler için heap'siz en kısa yol.
+
+GridMap grid'lerinde her adım 1 maliyetli; bu durumda Dijkstra'nın
+binary heap'i (O(log V) push/pop) gereksiz:
+
+    - bfs_shortest_path : deque ile BFS, O(V + E)
+    - dial_shortest_path: Dial bucket kuyruğu, hücreye girme maliyeti
+                          0..C arası tamsayı ise O(V + E + C·cost)
+
+Hangi motorun seçileceğine planner.select_engine karar verir.
+"""
+
+import time
+from array import array
+from collections import deque
+
+import numpy as np
+
+from flat_search import INF, as_flat, check_trace, _extract_path, _trace_result
+from instrument import lazy_heap_counts
+
+
+def bfs_tree(fg, s, g=-1, stats=None, order=None):
+    """
+    FlatGrid üzerinde s kökünden BFS. g verilirse g çıkarıldığında durur.
+    stats: opsiyonel instrument.Stats (yalnızca sayaçlar)
+    order: verilirse genişletilen indeksler sırayla eklenir (array("i"))
+
+    Returns: dist (int32), prev (int32), closed (uint8), expanded
+    """
+    blocked = fg.blocked
+    offsets = fg.offsets
+
+    dist = array("i", [INF]) * fg.size
+    prev = array("i", [-1]) * fg.size
+    closed = bytearray(fg.size)
+    expanded = 0
+
+    dist[s] = 0
+    q = deque([s])
+    popleft = q.popleft
+    append = q.append
+    peak = 1
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+
+    while q:
+        u = popleft()
+        closed[u] = 1
+        expanded += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(fg.cell(u))
+
+        if u == g:
+            break
+
+        nd = dist[u] + 1
+        for off in offsets:
+            v = u + off
+            if not blocked[v] and dist[v] == INF:
+                dist[v] = nd
+                prev[v] = u
+                append(v)
+
+        if instrumented and len(q) > peak:
+            peak = len(q)
+
+    if stats is not None:
+        # her hücre kuyruğa bir kez girer: stale kayıt ve yeniden açma yok
+        pushes = expanded + len(q)
+        stats.record(pushes=pushes, pops=expanded, stale_pops=0,
+                     relaxations=pushes - 1, reopenings=0, peak_open=peak)
+
+    return dist, prev, closed, expanded
+
+
+def bfs_shortest_path(grid, start, goal, stats=None, trace="visited"):
+    """
+    Birim maliyetli grid için BFS. dijkstra.dijkstra ile aynı arayüz.
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (flat_search.TRACE_MODES)
+
+    Returns: path, cost, expanded, runtime, visited
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = as_flat(grid)
+    s = fg.index(start)
+    g = fg.index(goal)
+    dist, prev, closed, expanded = bfs_tree(fg, s, g, stats, order)
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if dist[g] < INF:
+        path = _extract_path(fg, prev, s, g)
+        cost = dist[g]
+    visited = _trace_result(fg, trace, closed, order)
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited
+
+
+def dial_shortest_path(grid, start, goal, cost_grid, stats=None, trace="visited"):
+    """
+    Dial algoritması (dairesel bucket kuyruğu).
+
+    cost_grid: (rows, cols) tamsayı tablo, hücreye girme maliyeti (>= 0).
+               En büyük maliyet C ise C+1 bucket kullanılır.
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (flat_search.TRACE_MODES)
+
+    Returns: path, cost, expanded, runtime, visited
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = as_flat(grid)
+    blocked = fg.blocked
+    offsets = fg.offsets
+    weights = fg.pad_values(cost_grid, 0)
+
+    nb = int(np.max(cost_grid)) + 1
+    buckets = [[] for _ in range(nb)]
+
+    dist = array("i", [INF]) * fg.size
+    prev = array("i", [-1]) * fg.size
+    closed = bytearray(fg.size)
+    expanded = 0
+
+    s = fg.index(start)
+    g = fg.index(goal)
+    dist[s] = 0
+    buckets[0].append(s)
+    pending = pushes = peak = 1
+    cur = 0
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+
+    while pending:
+        bucket = buckets[cur % nb]
+        while not bucket:
+            cur += 1
+            bucket = buckets[cur % nb]
+
+        u = bucket.pop()
+        pending -= 1
+        if closed[u] or dist[u] != cur:
+            continue  # eski (stale) kayıt
+
+        closed[u] = 1
+        expanded += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(fg.cell(u))
+
+        if u == g:
+            break
+
+        for off in offsets:
+            v = u + off
+            if not blocked[v]:
+                nd = cur + weights[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    prev[v] = u
+                    buckets[nd % nb].append(v)
+                    pending += 1
+                    pushes += 1
+
+        if instrumented and pending > peak:
+            peak = pending
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if dist[g] < INF:
+        path = _extract_path(fg, prev, s, g)
+        cost = dist[g]
+    visited = _trace_result(fg, trace, closed, order)
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.record(**lazy_heap_counts(pushes, pending, expanded, peak))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited
@@ -0,0 +1,229 @@
+"""
+Boş hücrelerin bağlı bileşen (connected component) indeksi.
+
+Hedef duvarla çevriliyse dijkstra / astar erişilebilir bölgenin tamamını
+tarayıp boş yol döner, dp ise tüm iterasyon bütçesini harcar. Bileşen
+etiketleri bir kez hesaplanınca "yol var mı?" sorusu O(1) olur:
+
+    index = ComponentIndex(gm.grid)
+    index.connected(gm.start, gm.goal)
+
+Etiketleme düz diziler üzerinde vektörize union-find ile yapılır: her
+turda kenarın iki ucunun kökleri farklıysa büyük kök küçüğe bağlanır
+(hooking), ardından pointer jumping ile ağaçlar düzleştirilir. Tur sayısı
+pratikte O(log N) civarındadır.
+
+Tek hücre değişiklikleri artımlı işlenir:
+    engel -> boş : komşu bileşenler birleştirilir (yeni etiket ya da birleşim)
+    boş -> engel : komşular hücreyi çevreleyen 3x3 halka üzerinden
+                   birbirine bağlıysa bileşen bölünemez; aksi halde
+                   komşulardan eş zamanlı aramalar yapılır ve ayrılan
+                   (küçük) parçalar yeni etiket alır
+"""
+
+import numpy as np
+
+
+def _label(free):
+    """
+    free: (rows, cols) bool dizi
+    Returns: labels (rows, cols) int32, engelde -1, bileşenler 0..count-1; count
+    """
+    rows, cols = free.shape
+    flat = free.reshape(-1)
+    idx = np.arange(flat.size, dtype=np.int64).reshape(rows, cols)
+
+    # 4-komşu kenarlar (her iki ucu da boş olanlar)
+    right = free[:, :-1] & free[:, 1:]
+    down = free[:-1, :] & free[1:, :]
+    u = np.concatenate([idx[:, :-1][right], idx[:-1, :][down]])
+    v = np.concatenate([idx[:, 1:][right], idx[1:, :][down]])
+
+    parent = np.arange(flat.size, dtype=np.int64)
+    while True:
+        ru, rv = parent[u], parent[v]
+        diff = ru != rv
+        if not diff.any():
+            break
+
+        # hooking: kökler küçük indekse bağlanır (döngü oluşamaz)
+        ru, rv = ru[diff], rv[diff]
+        np.minimum.at(parent, np.maximum(ru, rv), np.minimum(ru, rv))
+
+        # pointer jumping: her düğüm doğrudan köküne işaret edene kadar
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+        # sonraki turda yalnızca henüz birleşmemiş kenarlar
+        u, v = u[diff], v[diff]
+
+    labels = np.full(flat.size, -1, dtype=np.int32)
+    roots, inverse = np.unique(parent[flat], return_inverse=True)
+    labels[flat] = inverse
+    return labels.reshape(rows, cols), len(roots)
+
+
+class ComponentIndex:
+    """
+    labels[r, c]: hücrenin bileşen etiketi (engel -> -1).
+    Artımlı güncellemelerden sonra etiketler ardışık olmayabilir;
+    count her zaman güncel bileşen sayısıdır.
+    """
+    def __init__(self, grid):
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        self.free = grid == 0
+        self.labels, self.count = _label(self.free)
+        self._next_label = self.count
+
+    def label(self, cell):
+        return int(self.labels[cell])
+
+    def connected(self, a, b):
+        """a ve b aynı bileşendeki boş hücreler mi (O(1))."""
+        la = self.labels[a]
+        return bool(la >= 0 and la == self.labels[b])
+
+    def component_size(self, cell):
+        lab = self.labels[cell]
+        return 0 if lab < 0 else int(np.count_nonzero(self.labels == lab))
+
+    def _free_neighbors(self, r, c):
+        for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols and self.free[nr, nc]:
+                yield nr, nc
+
+    def update_cell(self, cell, new_state):
+        """
+        new_state = 0 → boş
+        new_state = 1 → engel
+        """
+        r, c = cell
+        free = new_state == 0
+        if self.free[r, c] == free:
+            return
+
+        self.free[r, c] = free
+        neighbors = list(self._free_neighbors(r, c))
+
+        if free:
+            found = sorted({int(self.labels[nb]) for nb in neighbors})
+            if not found:
+                self.labels[r, c] = self._next_label
+                self._next_label += 1
+                self.count += 1
+                return
+
+            keep = found[0]
+            self.labels[r, c] = keep
+            if len(found) > 1:
+                self.labels[np.isin(self.labels, found[1:])] = keep
+                self.count -= len(found) - 1
+            return
+
+        # boş -> engel
+        self.labels[r, c] = -1
+        if not neighbors:
+            self.count -= 1
+            return
+        if len(neighbors) == 1:
+            return  # yaprak hücre: bileşen bölünemez
+
+        groups = self._ring_groups(r, c, neighbors)
+        if len(groups) == 1:
+            return  # komşular hücrenin çevresinden birbirine bağlı
+
+        self._split(groups)
+
+    def _ring_groups(self, r, c, neighbors):
+        """
+        Hücreyi çevreleyen 8 hücrelik halkada birbirine bitişik boş
+        hücreler üzerinden bağlanan 4-komşuları gruplar; her gruptan bir
+        temsilci döner.
+        """
+        ring = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+        free = [0 <= r + dr < self.rows and 0 <= c + dc < self.cols
+                and bool(self.free[r + dr, c + dc]) for dr, dc in ring]
+
+        if all(free):
+            return [neighbors[0]]
+
+        # halkayı boş olmayan bir hücreden başlatıp ardışık boş dizileri ayır
+        start = free.index(False)
+        groups, current = [], None
+        for k in range(1, 9):
+            i = (start + k) % 8
+            if not free[i]:
+                current = None
+                continue
+            if current is None:
+                current = []
+                groups.append(current)
+            dr, dc = ring[i]
+            if dr == 0 or dc == 0:
+                current.append((r + dr, c + dc))
+
+        return [g[0] for g in groups if g]
+
+    def _split(self, seeds):
+        """
+        Her temsilciden sırayla birer adım ilerleyen eş zamanlı aramalar. Aramalar karşılaşınca
+        birleşir; kapanan (frontier'ı biten) arama ayrı bir parçadır ve yeni
+        etiket alır. Maliyet küçük parçaların boyutuyla sınırlı kalır.
+        """
+        cols = self.cols
+        labels = self.labels.reshape(-1)
+        owner = {}
+        root = list(range(len(seeds)))
+        frontier = []
+        seen = []
+
+        def find(i):
+            while root[i] != i:
+                root[i] = root[root[i]]
+                i = root[i]
+            return i
+
+        for i, (sr, sc) in enumerate(seeds):
+            node = sr * cols + sc
+            owner[node] = i
+            frontier.append([node])
+            seen.append([node])
+
+        active = set(range(len(seeds)))
+        while len(active) > 1:
+            for i in list(active):
+                if i not in active:
+                    continue
+                if not frontier[i]:
+                    # ayrı parça: yeni etiket
+                    labels[seen[i]] = self._next_label
+                    self._next_label += 1
+                    self.count += 1
+                    active.discard(i)
+                    if len(active) == 1:
+                        break
+                    continue
+
+                node = frontier[i].pop()
+                nr, nc = divmod(node, cols)
+                for vr, vc in self._free_neighbors(nr, nc):
+                    v = vr * cols + vc
+                    j = owner.get(v)
+                    if j is None:
+                        owner[v] = i
+                        frontier[i].append(v)
+                        seen[i].append(v)
+                        continue
+                    j = find(j)
+                    if j != i:
+                        # karşılaşma: j aramasını i'ye kat
+                        root[j] = i
+                        frontier[i].extend(frontier[j])
+                        seen[i].extend(seen[j])
+                        frontier[j], seen[j] = [], []
+                        active.discard(j)
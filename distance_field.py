@@ -0,0 +1,132 @@
+"""
+Tek kökten tüm grid'e (one-to-many) mesafe alanı ve en kısa yol ağacı.
+
+Aynı hedefe (örn. depo) farklı yerlerden gelen sorgularda her seferinde
+arama yapmak yerine goal kökünden bir kez BFS çalıştırılır:
+
+    dist[r, c]  : köke en kısa mesafe (int32, erişilemez = INF)
+    pred[r, c]  : köke doğru bir sonraki hücrenin düz indeksi r*cols+c
+                  (int32, kök ve erişilemez hücreler için -1)
+
+Grid 4-komşulu ve yönsüz olduğundan aynı alan "kökten" sorgular için de
+kullanılır (yol ters çevrilir). DistanceFieldCache alanları
+(grid parmak izi, kök) anahtarıyla LRU olarak tutar; sonraki sorgular
+arama yapmadan O(yol uzunluğu) yürüyüşle cevaplanır.
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from grid import grid_fingerprint
+from flat_search import INF, FlatGrid
+from bucket_search import bfs_tree
+
+
+class DistanceField:
+    def __init__(self, root, dist, pred, expanded=0):
+        self.root = root
+        self.dist = dist
+        self.pred = pred
+        self.expanded = expanded  # alanı kurarken açılan düğüm sayısı
+
+    @property
+    def nbytes(self):
+        return self.dist.nbytes + self.pred.nbytes
+
+    def distance(self, cell):
+        d = int(self.dist[cell])
+        return None if d >= INF else d
+
+    def path_to_root(self, cell):
+        """cell -> root hücre listesi; erişilemezse None."""
+        if self.dist[cell] >= INF:
+            return None
+
+        cols = self.dist.shape[1]
+        pred = self.pred.reshape(-1)
+        path = [tuple(cell)]
+        idx = cell[0] * cols + cell[1]
+        while pred[idx] >= 0:
+            idx = int(pred[idx])
+            path.append(divmod(idx, cols))
+        return path
+
+    def path_from_root(self, cell):
+        path = self.path_to_root(cell)
+        return None if path is None else path[::-1]
+
+
+def distance_field(grid, root):
+    """
+    grid: numpy array (0 boş, 1 engel) ya da FlatGrid
+    root: (r, c)
+
+    Returns: DistanceField
+    """
+    fg = grid if isinstance(grid, FlatGrid) else FlatGrid(grid)
+    dist, prev, _, expanded = bfs_tree(fg, fg.index(root))
+
+    shape = (fg.rows + 2, fg.width)
+    dist = np.frombuffer(dist, dtype=np.int32).reshape(shape)[1:-1, 1:-1].copy()
+    prev = np.frombuffer(prev, dtype=np.int32).reshape(shape)[1:-1, 1:-1]
+
+    # padded indeks -> düz (r * cols + c) indeks
+    pr, pc = np.divmod(prev, fg.width)
+    pred = np.where(prev >= 0, (pr - 1) * fg.cols + (pc - 1), -1).astype(np.int32)
+
+    return DistanceField(tuple(root), dist, pred, expanded)
+
+
+class DistanceFieldCache:
+    """
+    (grid parmak izi, kök) -> DistanceField, en fazla maxsize kayıt (LRU).
+    """
+    def __init__(self, maxsize=16):
+        self.maxsize = int(maxsize)
+        self._fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._fields)
+
+    def get(self, grid, root, fingerprint=None):
+        """fingerprint verilirse grid yeniden özetlenmez."""
+        key = (fingerprint or grid_fingerprint(grid), tuple(root))
+
+        field = self._fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self._fields.move_to_end(key)
+            return field
+
+        self.misses += 1
+        field = distance_field(grid, root)
+        self._fields[key] = field
+        if len(self._fields) > self.maxsize:
+            self._fields.popitem(last=False)
+        return field
+
+    def clear(self):
+        self._fields.clear()
+
+    def route(self, grid, start, goal, fingerprint=None):
+        """
+        goal köklü alanla start -> goal yolu.
+
+        Returns: path, cost, expanded, runtime, visited
+            (önbellekten gelirse expanded = 0, visited boş)
+        """
+        t0 = time.perf_counter()
+
+        misses = self.misses
+        field = self.get(grid, goal, fingerprint)
+        expanded = field.expanded if self.misses > misses else 0
+
+        path = field.path_to_root(start)
+        cost = field.distance(start)
+
+        runtime = time.perf_counter() - t0
+        return path, cost, expanded, runtime, set()
@@ -1,16 +1,111 @@
 import time
+import warnings
 import numpy as np
 
+from flat_search import check_trace
+
 DIRS = [(0,1), (1,0), (-1,0), (0,-1)]
 
-def dp_shortest_path(grid, start, goal, max_iters=200):
+INF = 10**9
+
+def _neighbor_views(padded, rows, cols):
+    """
+    padded: kenarları INF ile doldurulmuş (rows+2, cols+2) tablo.
+    Her DIRS yönü için (r,c) hücresine (r+dr, c+dc) komşusunun değerini
+    hizalayan kaydırılmış görünümler (kopya yok).
+    """
+    return [padded[1+dr:1+dr+rows, 1+dc:1+dc+cols] for dr, dc in DIRS]
+
+def _dp_table(grid, start):
+    """
+    Start'ta 0, diğer hücrelerde INF olan dp tablosu.
+
+    Returns: dp (padded tablonun iç görünümü), komşu görünümleri, free maskesi
+    """
+    rows, cols = grid.shape
+    # padded: kenar kontrolü gerekmesin
+    padded = np.full((rows + 2, cols + 2), INF, dtype=float)
+    dp = padded[1:-1, 1:-1]
+    dp[start] = 0
+    return dp, _neighbor_views(padded, rows, cols), grid == 0
+
+def _dp_sweeps(dp, neighbors, free, max_iters):
+    """
+    Jacobi tarzı gevşetme: her iterasyonda tüm tablo komşuların kaydırılmış
+    minimumu ile yerinde güncellenir ve iyileşen hücrelerin maskesi verilir.
+    Hiçbir hücre değişmediğinde durur. Dönüş değeri (StopIteration.value)
+    tam tablo geçişi sayısıdır (son, değişmeyen geçiş dahil).
+
+    max_iters sınırına yakınsamadan ulaşılırsa RuntimeWarning verilir.
+    """
+    for iteration in range(1, max_iters + 1):
+        best = np.minimum(
+            np.minimum(neighbors[0], neighbors[1]),
+            np.minimum(neighbors[2], neighbors[3])
+        ) + 1
+
+        improved = free & (best < dp)
+        if not improved.any():
+            # Artık değişiklik yok → DP stabilize oldu
+            return iteration
+
+        dp[improved] = best[improved]
+        yield improved
+
+    warnings.warn(
+        f"dp_shortest_path: max_iters={max_iters} sınırına yakınsamadan "
+        "ulaşıldı, sonuç en kısa yol olmayabilir",
+        RuntimeWarning,
+        stacklevel=3
+    )
+    return max_iters
+
+def _extract_dp_path(dp, neighbors, start, goal):
+    """
+    Goal'dan start'a en küçük dp'li komşuyu izler (eşitlikte DIRS sırası).
+    Tablo tutarsızsa None.
     """
-    Dynamic Programming tabanlı grid shortest path.
+    stacked = np.stack(neighbors)
+    step = stacked.argmin(axis=0)
+    step_val = stacked.min(axis=0)
+
+    path = []
+    node = goal
+    while node != start:
+        path.append(node)
+
+        if step_val[node] >= dp[node]:
+            # DP tablo tutarsızlığı: yol yok
+            return None
+
+        dr, dc = DIRS[step[node]]
+        node = (node[0] + dr, node[1] + dc)
+
+    path.append(start)
+    path.reverse()
+    return path
+
+def dp_shortest_path(grid, start, goal, max_iters=None, stats=None, trace="visited"):
+    """
+    Dynamic Programming tabanlı grid shortest path (vektörize).
+
+    Her iterasyonda tüm dp tablosu, komşu tablolarının kaydırılmış
+    minimumu ile tek seferde güncellenir (Bellman-Ford / Jacobi tarzı).
+    Hiçbir hücre değişmediğinde durur.
 
     grid: numpy array (0 free, 1 obstacle)
     start: (r,c)
     goal: (r,c)
-    max_iters: DP güncelleme sayısı (bellman-like)
+    max_iters: DP güncelleme sayısı üst sınırı. None ise grid'den türetilir
+               (boş hücre sayısı: hiçbir en kısa yol bundan uzun olamaz).
+               Sınıra yakınsamadan ulaşılırsa RuntimeWarning verilir.
+    stats: opsiyonel instrument.Stats. Open listesi yok; relaxations
+           iyileşen hücre güncellemeleri, ek sayaç "iterations" tam tablo
+           geçişleridir. on_expand çağrılmaz; relaxations her iterasyonda
+           iyileşen hücre sayısıyla record() edilir (on_report ilerleme için).
+    trace: visited_order biçimi (flat_search.TRACE_MODES):
+           "visited" tuple listesi, "order" (k, 2) int32 dizi,
+           "counts" güncelleme sayısı, "none" None
 
     Returns:
         path
@@ -20,77 +115,61 @@ def dp_shortest_path(grid, start, goal, max_iters=200):
         visited_order (DP propagation sırasında dokunulan hücreler)
     """
 
-    n = grid.shape[0]
-    INF = 10**9
+    check_trace(trace)
+    grid = np.asarray(grid)
 
-    # DP tablosu
-    dp = np.full((n, n), INF, dtype=float)
-
-    # Start 0 maliyet
-    dp[start] = 0
+    dp, neighbors, free = _dp_table(grid, start)
+    if max_iters is None:
+        max_iters = max(int(free.sum()), 1)
 
     visited_order = []
+    expanded = 0
     t0 = time.perf_counter()
 
-    # Bellman-Ford'un grid versiyonu gibi çalışıyoruz
-    for iteration in range(max_iters):
-
-        changed = False
-
-        for r in range(n):
-            for c in range(n):
-                if grid[r][c] == 1:
-                    continue  # obstacle
-
-                best = dp[r][c]
-
-                for dr, dc in DIRS:
-                    nr, nc = r+dr, c+dc
-                    if 0 <= nr < n and 0 <= nc < n:
-                        if grid[nr][nc] == 1:
-                            continue
-                        best = min(best, dp[nr][nc] + 1)
-
-                if best < dp[r][c]:
-                    dp[r][c] = best
-                    changed = True
-                    visited_order.append((r,c))
-
-        if not changed:
-            # Artık değişiklik yok → DP stabilize oldu
+    sweeps = _dp_sweeps(dp, neighbors, free, max_iters)
+    while True:
+        try:
+            improved = next(sweeps)
+        except StopIteration as done:
+            iterations = done.value
             break
 
+        if trace == "visited":
+            rs, cs = np.nonzero(improved)
+            visited_order.extend(zip(rs.tolist(), cs.tolist()))
+            count = len(rs)
+        elif trace == "order":
+            visited_order.append(np.argwhere(improved).astype(np.int32))
+            count = len(visited_order[-1])
+        else:
+            count = int(np.count_nonzero(improved))
+        expanded += count
+        if stats is not None:
+            # sweep başına tek bildirim; on_report ilerlemeyi buradan izler
+            stats.record(relaxations=count)
+
     runtime = time.perf_counter() - t0
-    expanded = len(visited_order)
+    if trace == "order":
+        visited_order = (np.concatenate(visited_order) if visited_order
+                         else np.empty((0, 2), dtype=np.int32))
+    elif trace == "counts":
+        visited_order = expanded
+    elif trace == "none":
+        visited_order = None
+    if stats is not None:
+        stats.record(pushes=0, pops=0, stale_pops=0, reopenings=0, peak_open=0,
+                     iterations=iterations)
+        stats.add_time("search", runtime)
 
     # Eğer goal erişilemezse
     if dp[goal] >= INF:
         return None, None, expanded, runtime, visited_order
 
     # Şimdi path çıkaralım (Goal → Start yönünde)
-    path = []
-    node = goal
-    while node != start:
-        path.append(node)
-        r, c = node
-
-        best = dp[r][c]
-        next_node = None
-
-        for dr, dc in DIRS:
-            nr, nc = r+dr, c+dc
-            if 0 <= nr < n and 0 <= nc < n:
-                if dp[nr][nc] < best:
-                    best = dp[nr][nc]
-                    next_node = (nr, nc)
-
-        if next_node is None:
-            # DP tablo tutarsızlığı: yol yok
-            return None, None, expanded, runtime, visited_order
-
-        node = next_node
-
-    path.append(start)
-    path.reverse()
+    path = _extract_dp_path(dp, neighbors, start, goal)
+    if path is None:
+        return None, None, expanded, runtime, visited_order
 
+    if stats is not None:
+        stats.add_time("extract", time.perf_counter() - t0 - runtime)
     return path, dp[goal], expanded, runtime, visited_order
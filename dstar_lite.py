@@ -1,6 +1,6 @@
-import heapq
 import time
-import math
+
+from indexed_heap import IndexedHeap
 
 DIRS = [(0,1),(1,0),(-1,0),(0,-1)]
 
@@ -10,129 +10,201 @@ def heuristic(a, b):
     return abs(a[0]-b[0]) + abs(a[1]-b[1])  # manhattan
 
 class DStarLite:
-    def __init__(self, grid, start, goal):
+    def __init__(self, grid, start, goal, components=None, graph=None):
         self.grid = grid
-        self.n = grid.shape[0]
+        self.rows, self.cols = grid.shape
+        self.n = self.rows
 
         self.start = start
         self.goal = goal
 
+        # g / rhs: düz indeks (r * cols + c) -> değer.
+        # Kaydı olmayan hücre INF kabul edilir (tembel başlatma, O(1) kurulum).
         self.g = {}
         self.rhs = {}
 
-        self.U = []  # priority queue
-
-        # Varsayılan değerler
-        for r in range(self.n):
-            for c in range(self.n):
-                self.g[(r,c)] = INF
-                self.rhs[(r,c)] = INF
+        # priority queue: her düğüm en fazla bir kez (update / remove destekli)
+        self.U = IndexedHeap()
 
-        self.rhs[self.goal] = 0  # hedef için rhs = 0
+        self._goal = self._index(goal)
+        self.rhs[self._goal] = 0  # hedef için rhs = 0
 
         self.km = 0  # key modifier
 
-        self._insert(self.goal, self._calculate_key(self.goal))
+        # opsiyonel components.ComponentIndex: update_cells ile güncel tutulur,
+        # start ile goal ayrı bileşendeyse find_path arama yapmaz
+        self.components = components
+
+        # opsiyonel graph_index.GridGraph: komşular CSR indeksinden okunur,
+        # update_cells ile güncel tutulur (kenar ağırlıkları kullanılmaz)
+        self.graph = graph
+        self._neighbors = graph.neighbors_of if graph is not None else self._grid_neighbors
+
+        # instrument.Stats sayaçları (_insert / _update_vertex çağrıları)
+        self._pushes = 0
+        self._relaxations = 0
+        self.update_count = 0  # update_cells ile uygulanan toplam hücre değişikliği
+
+        self._insert(self._goal, self._calculate_key(self._goal))
 
     # ------------------------
     # PRIORITY QUEUE HELPERS
     # ------------------------
 
+    def _index(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def _cell(self, idx):
+        return divmod(idx, self.cols)
+
     def _calculate_key(self, node):
-        g_rhs = min(self.g[node], self.rhs[node])
-        return (g_rhs + heuristic(self.start, node) + self.km, g_rhs)
+        g_rhs = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        r, c = divmod(node, self.cols)
+        h = abs(self.start[0] - r) + abs(self.start[1] - c)  # manhattan
+        return (g_rhs + h + self.km, g_rhs)
 
     def _insert(self, node, key):
-        heapq.heappush(self.U, (key, node))
+        self._pushes += 1
+        self.U.push(node, key)
+
+    @property
+    def queue_size(self):
+        return len(self.U)
+
+    @property
+    def peak_queue_size(self):
+        return self.U.peak_size
 
     def _update_vertex(self, node):
-        if node != self.goal:
+        self._relaxations += 1
+        if node != self._goal:
+            g = self.g
             min_rhs = INF
-            for nr, nc in self._neighbors(node):
-                min_rhs = min(min_rhs, self.g[(nr, nc)] + 1)
-            self.rhs[node] = min_rhs
+            r, c = divmod(node, self.cols)
+            if self.grid[r, c] == 0:  # engel hücrenin tüm kenarları INF
+                for nb in self._neighbors(node):
+                    min_rhs = min(min_rhs, g.get(nb, INF) + 1)
+            if min_rhs >= INF:
+                self.rhs.pop(node, None)
+            else:
+                self.rhs[node] = min_rhs
 
-        # Eğer g ≠ rhs ise queue’ya ekle
-        if self.g[node] != self.rhs[node]:
+        # g ≠ rhs ise kuyruğa ekle / key'ini güncelle, tutarlıysa kuyruktan çıkar
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
             self._insert(node, self._calculate_key(node))
-
-    def _neighbors(self, node):
-        (r, c) = node
-        for dr, dc in DIRS:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.n and 0 <= nc < self.n:
-                if self.grid[nr][nc] == 0:  # free cell
-                    yield (nr, nc)
+        elif node in self.U:
+            self.U.remove(node)
+
+    def _grid_neighbors(self, node):
+        # DIRS sırası: (0,1), (1,0), (-1,0), (0,-1)
+        r, c = divmod(node, self.cols)
+        grid = self.grid
+        if c + 1 < self.cols and grid[r, c + 1] == 0:
+            yield node + 1
+        if r + 1 < self.rows and grid[r + 1, c] == 0:
+            yield node + self.cols
+        if r > 0 and grid[r - 1, c] == 0:
+            yield node - self.cols
+        if c > 0 and grid[r, c - 1] == 0:
+            yield node - 1
 
     # ------------------------
     # MAIN COMPUTE
     # ------------------------
 
-    def _compute_shortest_path(self):
+    def _compute_shortest_path(self, stats=None):
         expanded = 0
-
-        while self.U:
-            (k_old, node) = heapq.heappop(self.U)
+        stale = 0       # km değişimiyle key'i eskimiş tepe kayıtları
+        reopenings = 0  # g < rhs (underconsistent) düğümün g'si sıfırlanıp yeniden açılması
+        pushes, relaxations = self._pushes, self._relaxations
+        on_expand = stats.on_expand if stats is not None else None
+        g, rhs = self.g, self.rhs
+        s = self._index(self.start)
+
+        # start tutarlı ve kuyruktaki en küçük key start'ınkinden küçük
+        # değilse en kısa yol hazırdır (Koenig & Likhachev, D* Lite)
+        while self.U and (self.U.top_key() < self._calculate_key(s)
+                          or g.get(s, INF) != rhs.get(s, INF)):
+            (k_old, node) = self.U.top()
             k_new = self._calculate_key(node)
 
-            # Eğer eski entry ise atla
+            # km değiştiyse key'i tazele
             if k_old < k_new:
-                self._insert(node, k_new)
+                self.U.update(node, k_new)
+                stale += 1
                 continue
 
             expanded += 1
+            if on_expand is not None:
+                on_expand(self._cell(node))
 
             # Case 1: g > rhs → improve g
-            if self.g[node] > self.rhs[node]:
-                self.g[node] = self.rhs[node]
+            if g.get(node, INF) > rhs.get(node, INF):
+                g[node] = rhs[node]
+                self.U.remove(node)
 
                 # Komşuları güncelle
-                for nr, nc in self._neighbors(node):
-                    self._update_vertex((nr, nc))
+                for nb in self._neighbors(node):
+                    self._update_vertex(nb)
 
             # Case 2: g < rhs → degrade
             else:
-                self.g[node] = INF
-                for nr, nc in self._neighbors(node):
-                    self._update_vertex((nr, nc))
+                reopenings += 1
+                g.pop(node, None)  # g = INF
+                for nb in self._neighbors(node):
+                    self._update_vertex(nb)
                 self._update_vertex(node)
 
-            # Eğer start çözümlendiyse durabilir
-            if self.g[self.start] == self.rhs[self.start]:
-                break
-
+        if stats is not None:
+            stats.record(pushes=self._pushes - pushes + stale, pops=expanded + stale,
+                         stale_pops=stale, relaxations=self._relaxations - relaxations,
+                         reopenings=reopenings, peak_open=self.U.peak_size)
         return expanded
 
     # ------------------------
     # PUBLIC METHOD: FIND PATH
     # ------------------------
 
-    def find_path(self):
+    def find_path(self, stats=None):
+        """
+        stats: opsiyonel instrument.Stats
+
+        Returns: path, cost, expanded, runtime, update_count
+            update_count: şimdiye kadar update_cells ile uygulanan hücre değişikliği
+        """
         t0 = time.perf_counter()
+        update_count = self.update_count
+
+        if self.components is not None and not self.components.connected(self.start, self.goal):
+            return None, None, 0, time.perf_counter() - t0, update_count
 
-        expanded = self._compute_shortest_path()
+        expanded = self._compute_shortest_path(stats)
+        s = self._index(self.start)
+
+        t_search = time.perf_counter()
+        if stats is not None:
+            stats.add_time("search", t_search - t0)
 
         # PATH EXTRACTION
-        if self.g[self.start] >= INF:
+        if self.g.get(s, INF) >= INF:
             runtime = time.perf_counter() - t0
-            return None, None, expanded, runtime, 0
+            return None, None, expanded, runtime, update_count
 
         path = []
-        node = self.start
-        update_count = 0
+        node = s
 
-        while node != self.goal:
-            path.append(node)
+        while node != self._goal:
+            path.append(self._cell(node))
             best = INF
             next_node = None
 
             for nb in self._neighbors(node):
-                val = self.g[nb]
+                val = self.g.get(nb, INF)
                 if val < best:
                     best = val
                     next_node = nb
 
-            if next_node is None:
+            if next_node is None or len(path) > self.rows * self.cols:
                 runtime = time.perf_counter() - t0
                 return None, None, expanded, runtime, update_count
 
@@ -141,33 +213,73 @@ class DStarLite:
         path.append(self.goal)
 
         runtime = time.perf_counter() - t0
-        return path, self.g[self.start], expanded, runtime, update_count
+        if stats is not None:
+            stats.add_time("extract", t0 + runtime - t_search)
+        return path, self.g[s], expanded, runtime, update_count
 
     # ------------------------
     # DYNAMIC UPDATE (Traffic change)
     # ------------------------
 
-    def update_cell(self, cell, new_state):
+    def update_cells(self, changes, stats=None):
         """
-        Dinamik engel/değişiklik:
+        Toplu dinamik engel/değişiklik, sonra tek bir yeniden planlama.
+
+        changes: [((r, c), new_state), ...]
             new_state = 0 → boş
             new_state = 1 → engel
-        """
-        (r, c) = cell
-        old = self.grid[r][c]
-        self.grid[r][c] = new_state
+        stats: opsiyonel instrument.Stats (faz "update")
 
-        # Eğer durum değişmemişse bir şey yapma
-        if old == new_state:
+        Returns: yeniden planlamada genişletilen düğüm sayısı
+        """
+        touched = set()
+        for cell, new_state in changes:
+            (r, c) = cell
+            if self.grid[r, c] == new_state:
+                continue  # durum değişmemiş
+            self.grid[r, c] = new_state
+            touched.add(self._index(cell))
+            if self.components is not None:
+                self.components.update_cell(cell, new_state)
+            if self.graph is not None:
+                self.graph.update_cell(cell, new_state)
+
+        if not touched:
             return 0
 
-        self.km += heuristic(self.start, self.goal)
+        t0 = time.perf_counter()
+        self.update_count += len(touched)
+
+        # Değişen hücreler ve komşuları (kenar maliyeti değişen düğümler)
+        affected = set(touched)
+        for node in touched:
+            r, c = divmod(node, self.cols)
+            for dr, dc in DIRS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                    affected.add(nr * self.cols + nc)
 
-        # Etkilenen node'ları güncelle
-        for nb in self._neighbors(cell):
-            self._update_vertex(nb)
-        self._update_vertex(cell)
+        for node in sorted(affected):
+            self._update_vertex(node)
 
         # Yeniden planlama
-        expanded = self._compute_shortest_path()
+        expanded = self._compute_shortest_path(stats)
+        if stats is not None:
+            stats.add_time("update", time.perf_counter() - t0)
         return expanded
+
+    def update_cell(self, cell, new_state, stats=None):
+        """
+        Dinamik engel/değişiklik:
+            new_state = 0 → boş
+            new_state = 1 → engel
+        """
+        return self.update_cells([(cell, new_state)], stats)
+
+    def move_start(self, new_start):
+        """
+        Ajan ilerledi: start'ı taşır. Kuyruktaki key'ler eski start'a göre
+        hesaplandığından km, eski ve yeni start arası sezgi kadar artar.
+        """
+        self.km += heuristic(self.start, new_start)
+        self.start = new_start
@@ -0,0 +1,360 @@
+"""
+Düz (flat) dizi tabanlı Dijkstra / A* motoru.
+
+dijkstra.py ve astar.py'deki sürümler dist/g/prev için (r, c) tuple
+anahtarlı dict, visited için tuple set'i kullanıyor ve grid'i her adımda
+tek tek NumPy skaleri olarak okuyor. Bu modülde:
+
+    - grid bir kez kenarları engelle doldurulmuş (padded) düz uint8
+      buffer'a çevrilir -> komşu kontrolünde sınır kontrolü yok
+    - hücreler tek bir int indeksle temsil edilir: (r+1) * (cols+2) + (c+1)
+    - dist / prev önceden ayrılmış int32 dizilerde, closed bayrakları
+      uint8 dizide tutulur
+
+İndeks sırası (r, c) sözlük sırasıyla aynı olduğu için heap'teki eşitlik
+kırılımı da aynıdır; path / cost / expanded / visited sonuçları orijinal
+fonksiyonlarla birebir aynı döner.
+
+Ölçüm (obstacle_ratio=0.22, seed=42, köşeden köşeye, Python 3.11,
+visited set'inin oluşturulması dahil):
+
+    n      dijkstra    dijkstra_flat    astar      astar_flat
+    500    1.09 s      0.46 s           0.97 s     0.54 s
+    1000   7.9 s       2.4 s            3.1 s      1.5 s
+    2000   73.3 s      8.9 s            11.5 s     6.0 s
+
+Tepe bellek (tracemalloc, n=1000): dijkstra 309 MB / astar 125 MB.
+Düz dizilerle arama durumu dijkstra_flat 10 MB / astar_flat 16 MB
+(n=2000: 41 MB / 62 MB); geriye kalan kısım yalnızca dönen visited set'idir.
+"""
+
+import heapq
+import math
+import time
+from array import array
+
+import numpy as np
+
+from instrument import lazy_heap_counts
+
+INF = 2**31 - 1  # int32 üst sınırı
+
+# visited (5.) dönüş değerinin biçimi:
+#   "visited": (r, c) set'i (varsayılan, görselleştirme için)
+#   "counts" : yalnızca ziyaret edilen hücre sayısı (int)
+#   "order"  : genişletme sırasıyla (k, 2) int32 NumPy dizisi
+#   "none"   : None; hücre başına iz tutulmaz (batch / servis yolları)
+TRACE_MODES = ("visited", "counts", "order", "none")
+
+
+class FlatGrid:
+    """
+    Grid'in padded düz kopyası. Birden fazla sorguda tekrar kullanılabilir.
+
+    blocked[idx] == 1 -> engel (kenar dolgusu dahil)
+    """
+    def __init__(self, grid):
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        self.width = self.cols + 2
+
+        padded = np.ones((self.rows + 2, self.width), dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid != 0
+        self.blocked = bytearray(padded.tobytes())
+        self.size = len(self.blocked)
+
+        # dijkstra.py / astar.py ile aynı komşu sırası: (1,0), (-1,0), (0,1), (0,-1)
+        self.offsets = (self.width, -self.width, 1, -1)
+
+    @classmethod
+    def from_buffer(cls, blocked, rows, cols):
+        """
+        Hazır padded buffer'dan (örn. shared memory) kopyasız FlatGrid.
+        blocked: (rows+2) * (cols+2) uzunlukta, int indekslenebilir uint8 buffer
+        """
+        fg = cls.__new__(cls)
+        fg.rows, fg.cols = rows, cols
+        fg.width = cols + 2
+        fg.blocked = blocked
+        fg.size = len(blocked)
+        fg.offsets = (fg.width, -fg.width, 1, -1)
+        return fg
+
+    def padded_array(self):
+        """blocked buffer'ının (rows+2, cols+2) uint8 görünümü."""
+        return np.frombuffer(self.blocked, dtype=np.uint8).reshape(self.rows + 2, self.width)
+
+    def pad_values(self, values, fill):
+        """(rows, cols) değer tablosunu aynı padded indekslemeyle int32 diziye çevirir."""
+        padded = np.full((self.rows + 2, self.width), fill, dtype=np.int32)
+        padded[1:-1, 1:-1] = values
+        return array("i", padded.tobytes())
+
+    def index(self, cell):
+        r, c = cell
+        return (r + 1) * self.width + c + 1
+
+    def cell(self, idx):
+        r, c = divmod(idx, self.width)
+        return (r - 1, c - 1)
+
+    def cells(self, mask):
+        """uint8 bayrak dizisindeki işaretli indeksleri (r, c) set'ine çevirir."""
+        idx = np.flatnonzero(np.frombuffer(mask, dtype=np.uint8))
+        rs, cs = np.divmod(idx, self.width)
+        return set(zip((rs - 1).tolist(), (cs - 1).tolist()))
+
+    def cell_array(self, order):
+        """int32 indeks dizisini (k, 2) int32 (r, c) dizisine çevirir."""
+        idx = np.frombuffer(order, dtype=np.int32)
+        rs, cs = np.divmod(idx, self.width)
+        return np.stack([rs - 1, cs - 1], axis=1).astype(np.int32)
+
+
+def as_flat(grid):
+    return grid if isinstance(grid, FlatGrid) else FlatGrid(grid)
+
+
+def check_trace(trace):
+    if trace not in TRACE_MODES:
+        raise ValueError(f"Unknown trace mode: {trace}")
+    return array("i") if trace == "order" else None
+
+
+def _trace_result(fg, trace, closed, order):
+    """closed: uint8 bayrak buffer'ı, order: genişletme sırası (trace="order")."""
+    if trace == "visited":
+        return fg.cells(closed)
+    if trace == "counts":
+        return int(np.count_nonzero(np.frombuffer(closed, dtype=np.uint8)))
+    if trace == "order":
+        return fg.cell_array(order)
+    return None
+
+
+def _extract_path(fg, prev, s, g):
+    path = []
+    cur = g
+    while cur != s:
+        path.append(fg.cell(cur))
+        cur = prev[cur]
+    path.append(fg.cell(s))
+    path.reverse()
+    return path
+
+
+def _make_heuristic(fg, goal, mode, landmarks=None):
+    """
+    Düz indeks v için sezgi fonksiyonu h(v).
+    fg: FlatGrid ya da aynı width / index arayüzlü düz indeks
+        (örn. graph_index.GridGraph, dolgusuz)
+    """
+    W = fg.width
+    gr, gc = divmod(fg.index(goal), W)
+
+    if mode == "alt":
+        if landmarks is None:
+            raise ValueError("heuristic='alt' requires a landmark table")
+        g = fg.index(goal)
+        # goal'a erişemeyen landmark'lar bilgi taşımaz
+        tables = [(t, t[g]) for t in landmarks.padded(fg) if t[g] != landmarks.unreachable]
+
+        def h(v):
+            best = 0
+            for t, dg in tables:
+                d = t[v] - dg
+                if d < 0:
+                    d = -d
+                if d > best:
+                    best = d
+            return best
+    elif mode == "euclidean":
+        def h(v):
+            r = v // W
+            dr = abs(r - gr)
+            dc = abs(v - r * W - gc)
+            return math.sqrt(dr*dr + dc*dc)
+    elif mode == "chebyshev":
+        def h(v):
+            r = v // W
+            return max(abs(r - gr), abs(v - r * W - gc))
+    else:
+        def h(v):
+            r = v // W
+            return abs(r - gr) + abs(v - r * W - gc)
+    return h
+
+
+def dijkstra_flat(grid, start, goal, cost_grid=None, stats=None, trace="visited"):
+    """
+    dijkstra.dijkstra ile aynı arayüz ve sonuç.
+
+    grid: numpy array (0 boş, 1 engel) ya da FlatGrid
+    cost_grid: opsiyonel (rows, cols) tamsayı tablo; hücreye girme maliyeti.
+               None ise her adım 1.
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (TRACE_MODES)
+    Returns: path, cost, expanded, runtime, visited
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = as_flat(grid)
+    blocked = fg.blocked
+    offsets = fg.offsets
+
+    dist = array("i", [INF]) * fg.size
+    prev = array("i", [-1]) * fg.size
+    closed = bytearray(fg.size)
+    expanded = 0
+
+    s = fg.index(start)
+    g = fg.index(goal)
+    dist[s] = 0
+
+    pq = [(0, s)]
+    push = heapq.heappush
+    pop = heapq.heappop
+    pushes = peak = 1
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+
+    weights = None if cost_grid is None else fg.pad_values(cost_grid, 0)
+
+    while pq:
+        cost, u = pop(pq)
+        if closed[u]:
+            continue
+
+        closed[u] = 1
+        expanded += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(fg.cell(u))
+
+        if u == g:
+            break
+
+        if weights is None:
+            new_cost = cost + 1
+            for off in offsets:
+                v = u + off
+                if not blocked[v] and new_cost < dist[v]:
+                    dist[v] = new_cost
+                    prev[v] = u
+                    push(pq, (new_cost, v))
+                    pushes += 1
+        else:
+            for off in offsets:
+                v = u + off
+                if not blocked[v]:
+                    new_cost = cost + weights[v]
+                    if new_cost < dist[v]:
+                        dist[v] = new_cost
+                        prev[v] = u
+                        push(pq, (new_cost, v))
+                        pushes += 1
+
+        if instrumented and len(pq) > peak:
+            peak = len(pq)
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if dist[g] < INF:
+        path = _extract_path(fg, prev, s, g)
+        cost = dist[g]
+    visited = _trace_result(fg, trace, closed, order)
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.record(**lazy_heap_counts(pushes, len(pq), expanded, peak))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited
+
+
+def astar_flat(grid, start, goal, heuristic="manhattan", landmarks=None, stats=None,
+               trace="visited"):
+    """
+    astar.astar ile aynı arayüz ve sonuç.
+
+    grid: numpy array (0 boş, 1 engel) ya da FlatGrid
+    landmarks: heuristic="alt" için landmarks.LandmarkTable
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (TRACE_MODES)
+    Returns: path, cost, expanded, runtime, visited
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = as_flat(grid)
+    blocked = fg.blocked
+    offsets = fg.offsets
+    h = _make_heuristic(fg, goal, heuristic, landmarks)
+
+    gcost = array("i", [INF]) * fg.size
+    prev = array("i", [-1]) * fg.size
+    closed = bytearray(fg.size)
+    expanded = 0
+
+    s = fg.index(start)
+    g = fg.index(goal)
+    gcost[s] = 0
+
+    pq = [(h(s), 0, s)]  # (f, g, node)
+    push = heapq.heappush
+    pop = heapq.heappop
+    pushes = peak = 1
+    reopenings = 0  # tutarlı sezgilerde 0
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+
+    while pq:
+        f, gcur, u = pop(pq)
+        if closed[u]:
+            continue
+
+        closed[u] = 1
+        expanded += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(fg.cell(u))
+
+        if u == g:
+            break
+
+        tentative = gcur + 1
+        for off in offsets:
+            v = u + off
+            if not blocked[v] and tentative < gcost[v]:
+                gcost[v] = tentative
+                prev[v] = u
+                push(pq, (tentative + h(v), tentative, v))
+                pushes += 1
+                if closed[v]:
+                    reopenings += 1
+
+        if instrumented and len(pq) > peak:
+            peak = len(pq)
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if gcost[g] < INF:
+        path = _extract_path(fg, prev, s, g)
+        cost = gcost[g]
+    visited = _trace_result(fg, trace, closed, order)
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.record(**lazy_heap_counts(pushes, len(pq), expanded, peak, reopenings))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited
@@ -0,0 +1,306 @@
+"""
+Grid için önceden hesaplanmış CSR komşuluk indeksi.
+
+Planlayıcılar komşuları her genişletmede yön listelerinden, sınır ve
+engel kontrolüyle yeniden hesaplıyor. GridGraph bunu bir kez yapar:
+
+    offsets[u] .. offsets[u] + degree[u]  ->  neighbors[...] (+ weights[...])
+
+Düğüm numarası u = r * cols + c. Her düğümün listesi, düğümün kendi
+durumundan bağımsız olarak sınır içindeki boş 4-komşularını içerir
+(sıra flat_search ile aynı: (1,0), (-1,0), (0,1), (0,-1)). Böylece bir
+hücrenin durumu değiştiğinde yalnızca komşularının listeleri değişir.
+Her düğüme sabit 4 yuva ayrıldığından (offsets[u] = 4u) güncelleme
+yerinde, yeniden tahsis olmadan yapılır:
+
+    graph = GridGraph(gm.grid)                       # bir kez
+    run_planner("astar", gm.grid, s, g, graph=graph) # sorgular arasında paylaşılır
+    DStarLite(gm.grid, s, g, graph=graph)            # update_cells indeksi günceller
+
+weights (opsiyonel): kenar u -> v'nin maliyeti = cost_grid[v] (dijkstra'nın
+"hücreye girme maliyeti" tanımı).
+"""
+
+import heapq
+import time
+from array import array
+from collections import deque
+
+import numpy as np
+
+from flat_search import INF, check_trace, _make_heuristic
+from instrument import lazy_heap_counts
+
+# flat_search.FlatGrid.offsets ile aynı sıra
+DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+SLOTS = len(DIRS)
+
+
+class GridGraph:
+    """
+    neighbors: array("i"), 4 * N; kullanılmayan yuvalar -1
+    weights:   array("i"), 4 * N ya da None
+    degree:    bytearray, N
+    offsets:   array("i"), N + 1 (sabit adım: offsets[u] = 4u)
+    """
+    def __init__(self, grid, cost_grid=None):
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        self.width = self.cols  # düz indeks adımı (FlatGrid.width gibi, dolgusuz)
+        self.size = self.rows * self.cols
+        self.free = bytearray((grid == 0).astype(np.uint8).tobytes())
+
+        self.costs = None
+        if cost_grid is not None:
+            cost_grid = np.asarray(cost_grid)
+            if not np.issubdtype(cost_grid.dtype, np.integer):
+                raise ValueError("cost_grid must contain integer costs")
+            if cost_grid.size and cost_grid.min() < 0:
+                raise ValueError("cost_grid must be non-negative")
+            self.costs = array("i", cost_grid.astype(np.int32).tobytes())
+
+        nbr, deg = self._build(grid == 0)
+        self.neighbors = array("i", nbr.tobytes())
+        self.degree = bytearray(deg.tobytes())
+        self.offsets = array("i", range(0, SLOTS * self.size + 1, SLOTS))
+
+        self.weights = None
+        if self.costs is not None:
+            costs = np.frombuffer(self.costs, dtype=np.int32)
+            w = np.where(nbr >= 0, costs[np.maximum(nbr, 0)], 0).astype(np.int32)
+            self.weights = array("i", w.tobytes())
+
+    def _build(self, free):
+        """Vektörize kurulum: (N*4,) int32 komşu dizisi ve (N,) uint8 derece."""
+        rows, cols = self.rows, self.cols
+        idx = np.arange(self.size, dtype=np.int32).reshape(rows, cols)
+
+        # yön başına aday komşu; geçersiz (sınır dışı / engel) -> -1
+        cand = np.full((rows, cols, SLOTS), -1, dtype=np.int32)
+        for k, (dr, dc) in enumerate(DIRS):
+            src = (slice(max(-dr, 0), rows - max(dr, 0)), slice(max(-dc, 0), cols - max(dc, 0)))
+            dst = (slice(max(dr, 0), rows - max(-dr, 0)), slice(max(dc, 0), cols - max(-dc, 0)))
+            cand[src + (k,)] = np.where(free[dst], idx[dst], -1)
+
+        cand = cand.reshape(self.size, SLOTS)
+        valid = cand >= 0
+        # geçerliler yön sırası korunarak başa alınır
+        order = np.argsort(~valid, axis=1, kind="stable")
+        nbr = np.take_along_axis(cand, order, axis=1)
+        deg = valid.sum(axis=1).astype(np.uint8)
+        return nbr.reshape(-1), deg
+
+    @property
+    def nbytes(self):
+        total = self.neighbors.itemsize * len(self.neighbors) + len(self.degree)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+    def index(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def cell(self, node):
+        return divmod(node, self.cols)
+
+    def neighbors_of(self, node):
+        base = node * SLOTS
+        return self.neighbors[base:base + self.degree[node]]
+
+    def _rebuild(self, node):
+        """node'un listesini free'ye göre yeniden yazar (yön sırasıyla)."""
+        r, c = divmod(node, self.cols)
+        base = node * SLOTS
+        nbr, free, costs, weights = self.neighbors, self.free, self.costs, self.weights
+        k = 0
+        for dr, dc in DIRS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                v = nr * self.cols + nc
+                if free[v]:
+                    nbr[base + k] = v
+                    if weights is not None:
+                        weights[base + k] = costs[v]
+                    k += 1
+        for j in range(k, SLOTS):
+            nbr[base + j] = -1
+            if weights is not None:
+                weights[base + j] = 0
+        self.degree[node] = k
+
+    def update_cell(self, cell, new_state):
+        """
+        new_state = 0 → boş
+        new_state = 1 → engel
+        Yalnızca hücrenin 4 komşusunun listesi yeniden yazılır.
+        """
+        node = self.index(cell)
+        free = 1 if new_state == 0 else 0
+        if self.free[node] == free:
+            return
+        self.free[node] = free
+
+        r, c = cell
+        for dr, dc in DIRS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                self._rebuild(nr * self.cols + nc)
+
+    def set_cost(self, cell, cost):
+        """Ağırlıklı indekste hücreye girme maliyetini değiştirir."""
+        if self.costs is None:
+            raise ValueError("graph has no edge weights")
+        node = self.index(cell)
+        self.costs[node] = int(cost)
+        r, c = cell
+        for dr, dc in DIRS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                self._rebuild(nr * self.cols + nc)
+
+
+# ------------------------
+# İNDEKS ÜZERİNDEN ARAMA
+# ------------------------
+
+def graph_search(graph, start, goal, heuristic=None, landmarks=None, stats=None,
+                 trace="visited", weighted=False):
+    """
+    GridGraph üzerinde Dijkstra (heuristic None) / A*. weighted=True ise
+    kenar maliyetleri weights'ten, değilse (graf ağırlıklı kurulmuş olsa
+    bile) 1 alınır (A* sezgileri maliyetlerin >= 1 olduğunu varsayar).
+    Birim maliyetli Dijkstra BFS olarak çalışır (select_engine'deki "bfs"
+    seçimi gibi).
+
+    Returns: path, cost, expanded, runtime, visited
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    nbr = graph.neighbors
+    deg = graph.degree
+    weights = graph.weights if weighted else None
+    if weighted and weights is None:
+        raise ValueError("graph was built without edge weights")
+    h = None if heuristic is None else _make_heuristic(graph, goal, heuristic, landmarks)
+
+    dist = array("i", [INF]) * graph.size
+    prev = array("i", [-1]) * graph.size
+    closed = bytearray(graph.size)
+    expanded = 0
+
+    s = graph.index(start)
+    g = graph.index(goal)
+    dist[s] = 0
+
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+    reachable = graph.free[s] and graph.free[g]
+
+    if weights is None and h is None:
+        # birim maliyetli Dijkstra = BFS (bucket_search.bfs_tree ile aynı sıra)
+        q = deque([s] if reachable else [])
+        popleft = q.popleft
+        append = q.append
+        peak = 1
+        while q:
+            u = popleft()
+            closed[u] = 1
+            expanded += 1
+            if record is not None:
+                record(u)
+            if on_expand is not None:
+                on_expand(graph.cell(u))
+
+            if u == g:
+                break
+
+            nd = dist[u] + 1
+            base = u * SLOTS
+            for v in nbr[base:base + deg[u]]:
+                if dist[v] == INF:
+                    dist[v] = nd
+                    prev[v] = u
+                    append(v)
+
+            if instrumented and len(q) > peak:
+                peak = len(q)
+        pushes = expanded + len(q)
+        left = len(q)
+    else:
+        pq = [(h(s) if h is not None else 0, 0, s)] if reachable else []
+        push = heapq.heappush
+        pop = heapq.heappop
+        pushes = peak = 1
+
+        while pq:
+            _, cost, u = pop(pq)
+            if closed[u]:
+                continue
+
+            closed[u] = 1
+            expanded += 1
+            if record is not None:
+                record(u)
+            if on_expand is not None:
+                on_expand(graph.cell(u))
+
+            if u == g:
+                break
+
+            base = u * SLOTS
+            end = base + deg[u]
+            if weights is None:
+                new_cost = cost + 1
+                for v in nbr[base:end]:
+                    if new_cost < dist[v]:
+                        dist[v] = new_cost
+                        prev[v] = u
+                        push(pq, (new_cost + h(v), new_cost, v))
+                        pushes += 1
+            else:
+                for k in range(base, end):
+                    v = nbr[k]
+                    new_cost = cost + weights[k]
+                    if new_cost < dist[v]:
+                        dist[v] = new_cost
+                        prev[v] = u
+                        push(pq, (new_cost + h(v) if h is not None else new_cost, new_cost, v))
+                        pushes += 1
+
+            if instrumented and len(pq) > peak:
+                peak = len(pq)
+        left = len(pq)
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if closed[g] and dist[g] < INF:
+        cost = dist[g]
+        cur = g
+        while cur != s:
+            path.append(graph.cell(cur))
+            cur = prev[cur]
+        path.append(graph.cell(s))
+        path.reverse()
+
+    if trace == "visited":
+        idx = np.flatnonzero(np.frombuffer(closed, dtype=np.uint8))
+        rs, cs = np.divmod(idx, graph.cols)
+        visited = set(zip(rs.tolist(), cs.tolist()))
+    elif trace == "counts":
+        visited = expanded
+    elif trace == "order":
+        idx = np.frombuffer(order, dtype=np.int32)
+        visited = np.stack(np.divmod(idx, graph.cols), axis=1).astype(np.int32)
+    else:
+        visited = None
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.record(**lazy_heap_counts(pushes, left, expanded, peak))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited
@@ -1,35 +1,258 @@
+import hashlib
+import json
+import os
+
 import numpy as np
 
+from components import ComponentIndex
+from graph_index import GridGraph
+
+def grid_fingerprint(grid):
+    """
+    Grid içeriğinin hızlı özeti (blake2b, 128 bit hex).
+    Yalnızca şekil ve boş/engel bilgisine bakar; dtype'tan bağımsızdır.
+    Kendi özetini veren grid'ler (tiled_grid.TiledGrid) açılmaz.
+    """
+    if hasattr(grid, "fingerprint"):
+        return grid.fingerprint()
+    occupied = np.ascontiguousarray(np.asarray(grid) != 0)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(occupied.shape).encode())
+    h.update(occupied.view(np.uint8).data)
+    return h.hexdigest()
+
+STORAGES = ("uint8", "packed", "tiled")
+
+
+class PackedGrid:
+    """
+    Bit-packed doluluk grid'i: her satır np.packbits ile 8 hücre/bayt
+    (uint8 gridin 1/8'i, eski astype(int)'in 1/64'ü).
+
+    numpy dizisi gibi davranır:
+        np.asarray(pg)          -> açılmış (rows, cols) uint8 kopya
+        pg[r, c], pg[r, c] = v  -> tek hücre (bit) okuma / yazma
+        pg[r0:r1, c0:c1]        -> yalnızca ilgili satırlar açılır
+    Bu sayede np.asarray / grid[r, c] kullanan tüm planlayıcılar onu
+    doğrudan kabul eder. bits bir np.memmap olabilir (GridMap.load).
+    """
+    def __init__(self, bits, cols):
+        self.bits = bits
+        self.rows = bits.shape[0]
+        self.cols = int(cols)
+        self.shape = (self.rows, self.cols)
+        self.ndim = 2
+        self.dtype = np.dtype(np.uint8)
+
+    @classmethod
+    def from_array(cls, grid):
+        grid = np.asarray(grid)
+        return cls(np.packbits(grid != 0, axis=1), grid.shape[1])
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    @property
+    def size(self):
+        return self.rows * self.cols
+
+    def __array__(self, dtype=None, copy=None):
+        grid = np.unpackbits(self.bits, axis=1, count=self.cols)
+        return grid if dtype is None else grid.astype(dtype, copy=False)
+
+    def _unpack(self, rows):
+        return np.unpackbits(self.bits[rows], axis=-1, count=self.cols)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 2:
+            r, c = key
+            if isinstance(r, (int, np.integer)) and isinstance(c, (int, np.integer)):
+                c = c + self.cols if c < 0 else c
+                return (int(self.bits[r, c >> 3]) >> (7 - (c & 7))) & 1
+            return self._unpack(r)[..., c]
+        return self._unpack(key)
+
+    def __setitem__(self, key, value):
+        r, c = key
+        if isinstance(r, (int, np.integer)) and isinstance(c, (int, np.integer)):
+            c = c + self.cols if c < 0 else c
+            mask = 1 << (7 - (c & 7))
+            if value:
+                self.bits[r, c >> 3] |= mask
+            else:
+                self.bits[r, c >> 3] &= ~mask & 0xFF
+            return
+
+        # dilim ataması: ilgili satırlar açılıp yeniden paketlenir
+        rows = np.arange(self.rows)[r]
+        block = self._unpack(rows)
+        block[..., c] = np.asarray(value) != 0
+        self.bits[rows] = np.packbits(block, axis=-1)
+
+    def __eq__(self, other):
+        return np.asarray(self) == other
+
+    def __ne__(self, other):
+        return np.asarray(self) != other
+
+    __hash__ = None
+
+    def __len__(self):
+        return self.rows
+
+    def copy(self):
+        return PackedGrid(np.array(self.bits), self.cols)
+
+
 class GridMap:
     """
     0 = boş, 1 = engel
     start = (0,0), goal = (n-1,n-1)
     """
-    def __init__(self, n: int, obstacle_ratio: float, seed: int = 42):
+    def __init__(self, n: int, obstacle_ratio: float, seed: int = 42, storage: str = "uint8"):
+        if storage not in STORAGES:
+            raise ValueError(f"Unknown storage: {storage}")
         self.n = int(n)
         self.obstacle_ratio = float(obstacle_ratio)
         self.seed = int(seed)
+        # "uint8" (1 bayt/hücre), "packed" (PackedGrid) ya da "tiled"
+        # (tiled_grid.TiledGrid, parçalar ilk erişimde üretilir)
+        self.storage = storage
         self.grid = None
+        self.components = None  # components.ComponentIndex
+        self.graph = None       # graph_index.GridGraph
         self.start = (0, 0)
         self.goal = (self.n - 1, self.n - 1)
 
-    def generate(self):
+    def generate(self, ensure_path=False, max_tries=20):
+        """
+        ensure_path=True: start ile goal bağlı değilse aynı RNG akışından
+        yeni grid çekilir (en fazla max_tries kez, en az 1); hâlâ bağlı değilse
+        start -> goal arasında L biçimli bir koridor açılır.
+        Bağlılık ComponentIndex ile kontrol edilir, self.components'ta kalır.
+        storage="tiled" ise hiçbir hücre üretilmez (tembel TiledGrid);
+        ensure_path desteklenmez.
+        """
         rng = np.random.default_rng(self.seed)
         n = self.n
 
-        self.grid = (rng.random((n, n)) < self.obstacle_ratio).astype(int)
+        if self.storage == "tiled":
+            if ensure_path:
+                raise ValueError("ensure_path is not supported for tiled storage")
+            from tiled_grid import TiledGrid
+            self.start = (0, 0)
+            self.goal = (n - 1, n - 1)
+            self.components = None
+            self.graph = None
+            self.grid = TiledGrid(n, self.obstacle_ratio, self.seed)
+            return self.grid
 
         # start/goal açık olsun
         self.start = (0, 0)
         self.goal = (n - 1, n - 1)
-        self.grid[self.start] = 0
-        self.grid[self.goal] = 0
+        self.components = None
+        self.graph = None
+
+        # en az bir çekiliş: koridor açılacak bir grid olmalı
+        for _ in range(max(int(max_tries), 1) if ensure_path else 1):
+            grid = self._draw(rng)
+            if not ensure_path:
+                return self._store(grid)
+
+            self.components = ComponentIndex(grid)
+            if self.components.connected(self.start, self.goal):
+                return self._store(grid)
+
+        # koridor: önce ilk satır boyunca, sonra son sütun boyunca
+        grid[self.start[0], :] = 0
+        grid[:, self.goal[1]] = 0
+        self.components = ComponentIndex(grid)
+        return self._store(grid)
+
+    def _store(self, grid):
+        self.grid = PackedGrid.from_array(grid) if self.storage == "packed" else grid
+        return self.grid
+
+    def _draw(self, rng):
+        n = self.n
+        grid = (rng.random((n, n)) < self.obstacle_ratio).astype(np.uint8)
+
+        grid[self.start] = 0
+        grid[self.goal] = 0
 
         # start/goal çevresini de aç (pratikte yol bulmayı kolaylaştırır)
         for (r, c) in [self.start, self.goal]:
             for dr, dc in [(1,0), (-1,0), (0,1), (0,-1)]:
                 rr, cc = r + dr, c + dc
                 if 0 <= rr < n and 0 <= cc < n:
-                    self.grid[rr, cc] = 0
+                    grid[rr, cc] = 0
+
+        return grid
+
+    def component_index(self):
+        """Bileşen indeksi (ilk çağrıda kurulur; grid dışarıdan değişirse
+        update_cell ile güncel tutulmalı ya da components=None yapılmalı)."""
+        if self.components is None:
+            self.components = ComponentIndex(self.grid)
+        return self.components
+
+    def graph_index(self):
+        """CSR komşuluk indeksi (ilk çağrıda kurulur; grid dışarıdan değişirse
+        update_cell ile güncel tutulmalı ya da graph=None yapılmalı)."""
+        if self.graph is None:
+            self.graph = GridGraph(self.grid)
+        return self.graph
+
+    def fingerprint(self):
+        return grid_fingerprint(self.grid)
+
+    def as_array(self):
+        """Grid'in (rows, cols) uint8 numpy dizisi (packed ise açılmış kopya)."""
+        return np.asarray(self.grid, dtype=np.uint8)
+
+    # ------------------------
+    # SAVE / LOAD
+    # ------------------------
+
+    def save(self, path):
+        """
+        path: .npy dosyası; grid (uint8 ya da packed bitler) buraya, meta
+        bilgiler (boyut, seed, start/goal, storage) yanındaki .json'a yazılır.
+        """
+        base, _ = os.path.splitext(path)
+        grid = self.grid.bits if isinstance(self.grid, PackedGrid) else self.as_array()
+        np.save(base + ".npy", grid)
+
+        meta = {"n": self.n, "obstacle_ratio": self.obstacle_ratio, "seed": self.seed,
+                # tiled haritalar açılmış uint8 olarak yazılır
+                "storage": "packed" if isinstance(self.grid, PackedGrid) else "uint8",
+                "shape": list(np.shape(self.grid)),
+                "start": list(self.start), "goal": list(self.goal)}
+        with open(base + ".json", "w") as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        save ile yazılmış haritayı açar. mmap_mode np.load'a iletilir:
+            "r"  salt okunur memmap (varsayılan): anında açılır, işlemler
+                 arasında kopyasız paylaşılır; update_cell ValueError verir
+            "c"  copy-on-write: değişiklikler yalnızca bu işlemde kalır
+            "r+" değişiklikler dosyaya yazılır
+            None tamamen belleğe okunur
+        """
+        base, _ = os.path.splitext(path)
+        with open(base + ".json") as f:
+            meta = json.load(f)
+
+        gm = cls(meta["n"], meta["obstacle_ratio"], meta["seed"], meta["storage"])
+        gm.start = tuple(meta["start"])
+        gm.goal = tuple(meta["goal"])
 
-        return self.grid
\ No newline at end of file
+        data = np.load(base + ".npy", mmap_mode=mmap_mode)
+        if meta["storage"] == "packed":
+            gm.grid = PackedGrid(data, meta["shape"][1])
+        else:
+            gm.grid = data
+        return gm
@@ -1,5 +1,9 @@
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib
 # Tkinter ile kullanılacak doğru backend
@@ -10,6 +14,54 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from grid import GridMap
+from planner import ALGORITHMS, run_planner, select_engine
+from route_cache import RouteCache
+from instrument import Stats
+from render import render_rgb
+
+# arka plan sonuç kuyruğunun yoklanma aralığı
+POLL_MS = 40
+# ilerleme bildirimi / iptal kontrolü bu kadar genişletmede bir
+PROGRESS_EVERY = 512
+# canvas görüntüsünün en uzun kenarı (büyük gridler blok halinde küçültülür)
+MAX_PIXELS = 800
+
+
+class _Cancelled(Exception):
+    """Arka plandaki arama kullanıcı tarafından iptal edildi."""
+
+
+def solve(algo, grid, start, goal, heuristic="manhattan", components=None, stats=None):
+    """
+    Tek bir planlayıcı çalıştırması; hem worker thread'de hem de process
+    pool'da kullanılır (modül seviyesinde olduğu için pickle edilebilir).
+
+    Returns: path, cost, expanded, runtime, sides, counters, visited
+        sides: çift yönlü aramada "ileri/geri" genişletme, diğerlerinde "-"
+        visited: genişletilen hücreler, (k, 2) int32 dizi
+    """
+    sides = "-"
+    stats = stats if stats is not None else Stats()
+    landmarks = None
+    if heuristic == "alt" and algo in ("astar", "biastar"):
+        from landmarks import load_or_build
+        landmarks = load_or_build(grid)
+
+    if algo in ("bidijkstra", "biastar"):
+        from bidirectional import bidirectional_dijkstra, bidirectional_astar
+        if algo == "bidijkstra":
+            result = bidirectional_dijkstra(grid, start, goal, stats, trace="order")
+        else:
+            result = bidirectional_astar(grid, start, goal, heuristic, landmarks, stats,
+                                         trace="order")
+        path, cost, expanded, runtime, visited, (fwd, bwd) = result
+        sides = f"{fwd}/{bwd}"
+    else:
+        path, cost, expanded, runtime, visited = run_planner(
+            algo, grid, start, goal, heuristic, landmarks=landmarks,
+            components=components, stats=stats, trace="order"
+        )
+    return path, cost, expanded, runtime, sides, stats.counters, visited
 
 
 class RoutePlannerGUI:
@@ -21,9 +73,23 @@ class RoutePlannerGUI:
         # Data holders
         self.gridmap = None
         self.current_path = None
+        self.current_visited = None
+        self.image = None  # canvas'taki tek AxesImage; set_data ile güncellenir
         self.dstar_planner = None  # D* Lite instance
+        self.route_cache = RouteCache(maxsize=64)
+
+        # Arka plan işleri: worker thread sonuçları kuyruğa yazar, ana
+        # thread _poll ile okur (Tk widget'larına yalnızca ana thread dokunur)
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.busy = False
+        self.pool = None       # karşılaştırma için ProcessPoolExecutor (lazy)
+        self.pool_jobs = {}    # future -> (algo, cache key)
+        self.pool_total = 0
 
         self._build_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(POLL_MS, self._poll)
 
         # Pencere açılır açılmaz bir şey çizsin (boş ekran olmasın)
         self.draw_grid()
@@ -63,6 +129,8 @@ class RoutePlannerGUI:
         ttk.Radiobutton(lf_algo, text="A*", variable=self.algo_var, value="astar").pack(anchor="w")
         ttk.Radiobutton(lf_algo, text="DP", variable=self.algo_var, value="dp").pack(anchor="w")
         ttk.Radiobutton(lf_algo, text="Dynamic A*", variable=self.algo_var, value="dstar").pack(anchor="w")
+        ttk.Radiobutton(lf_algo, text="Bidirectional Dijkstra", variable=self.algo_var, value="bidijkstra").pack(anchor="w")
+        ttk.Radiobutton(lf_algo, text="Bidirectional A*", variable=self.algo_var, value="biastar").pack(anchor="w")
 
         # Heuristic selection (only for A*)
         ttk.Label(lf_algo, text="Heuristic (A*):").pack(anchor="w", pady=(8, 0))
@@ -70,7 +138,7 @@ class RoutePlannerGUI:
         heur_cb = ttk.Combobox(
             lf_algo,
             textvariable=self.heuristic_var,
-            values=["manhattan", "euclidean", "chebyshev"],
+            values=["manhattan", "euclidean", "chebyshev", "alt"],
             state="readonly"
         )
         heur_cb.pack(anchor="w")
@@ -83,20 +151,32 @@ class RoutePlannerGUI:
         ttk.Button(lf_run, text="Show Path", command=self.show_path).pack(fill="x", pady=3)
         ttk.Button(lf_run, text="Dynamic Update (D*)", command=self.dynamic_update).pack(fill="x", pady=3)
         ttk.Button(lf_run, text="Compare Results", command=self.open_compare_window).pack(fill="x", pady=3)
+        ttk.Button(lf_run, text="Run All (parallel)", command=self.run_all_parallel).pack(fill="x", pady=3)
+
+        self.progress = ttk.Progressbar(lf_run, mode="determinate", maximum=100)
+        self.progress.pack(fill="x", pady=(6, 2))
+        self.status_var = tk.StringVar(value="Idle")
+        ttk.Label(lf_run, textvariable=self.status_var).pack(anchor="w")
+        self.cancel_btn = ttk.Button(lf_run, text="Cancel", command=self.cancel_job, state="disabled")
+        self.cancel_btn.pack(fill="x", pady=3)
 
         # Results table
         lf_table = ttk.LabelFrame(left, text="Results (Runs)", padding=6)
         lf_table.pack(fill="both", expand=True, pady=6)
 
-        cols = ("algo", "time", "expanded", "cost")
+        cols = ("algo", "time", "expanded", "cost", "fwd/bwd", "pushes", "stale", "peak")
         self.table = ttk.Treeview(lf_table, columns=cols, show="headings", height=10)
 
         for c in cols:
             self.table.heading(c, text=c)
-            self.table.column(c, anchor="center", width=90)
+            self.table.column(c, anchor="center", width=70)
 
         self.table.pack(fill="both", expand=True)
 
+        self.cache_var = tk.StringVar()
+        ttk.Label(lf_table, textvariable=self.cache_var).pack(anchor="w", pady=(4, 0))
+        self._update_cache_label()
+
         # RIGHT PANEL (matplotlib canvas)
         right = ttk.Frame(main_frame)
         right.pack(side="left", fill="both", expand=True)
@@ -112,6 +192,10 @@ class RoutePlannerGUI:
     # -------------------------------------------------------
 
     def generate_grid(self):
+        # çalışan iş eski grid'in sonucunu yeni grid'e çizerdi
+        if self._refuse_if_busy():
+            return
+
         n = self.n_var.get()
         obs = self.obs_var.get()
 
@@ -124,6 +208,7 @@ class RoutePlannerGUI:
 
         self.dstar_planner = None
         self.current_path = None
+        self.current_visited = None
         self.draw_grid()
 
     def run_algorithm(self):
@@ -135,50 +220,77 @@ class RoutePlannerGUI:
         grid = self.gridmap.grid
         start = self.gridmap.start
         goal = self.gridmap.goal
+        components = self.gridmap.component_index()
 
-        try:
-            if algo == "dijkstra":
-                from dijkstra import dijkstra
-                path, cost, expanded, runtime, visited = dijkstra(grid, start, goal)
-
-            elif algo == "astar":
-                from astar import astar
-                heuristic = self.heuristic_var.get()
-                path, cost, expanded, runtime, visited = astar(grid, start, goal, heuristic)
-
-            elif algo == "dp":
-                from dp_path import dp_shortest_path
-                path, cost, expanded, runtime, visited = dp_shortest_path(grid, start, goal)
-
-            elif algo == "dstar":
-                from dstar_lite import DStarLite
-                if self.dstar_planner is None:
-                    self.dstar_planner = DStarLite(grid, start, goal)
-                path, cost, expanded, runtime, updates = self.dstar_planner.find_path()
-            else:
-                raise ValueError("Unknown algorithm")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Algo error: {e}")
+        heuristic = self.heuristic_var.get()
+        if algo not in ALGORITHMS and algo != "dstar":
+            messagebox.showerror("Error", "Algo error: Unknown algorithm")
             return
 
-        if path is None:
-            messagebox.showinfo("No Path", f"{algo} could not find a path.")
-            return
-
-        self.current_path = path
-        self.draw_grid(path=path)
+        def work():
+            stats = self._progress_stats()
+            if algo in ALGORITHMS:
+                # sezgi yalnızca A* türevlerinin sonucunu etkiler
+                params = {"heuristic": heuristic} if algo in ("astar", "biastar") else {}
+                return self.route_cache.fetch(
+                    grid, start, goal, algo,
+                    lambda: solve(algo, grid, start, goal, heuristic, components, stats),
+                    params
+                )
+
+            from dstar_lite import DStarLite
+            if self.dstar_planner is None:
+                self.dstar_planner = DStarLite(grid, start, goal, components=components)
+            path, cost, expanded, runtime, _ = self.dstar_planner.find_path(stats)
+            return (path, cost, expanded, runtime, "-", stats.counters, None), False
+
+        def done(payload):
+            result, cached = payload
+            self._update_cache_label()
+            if not result[0]:
+                messagebox.showinfo("No Path", f"{algo} could not find a path.")
+                return
+            self.current_path = result[0]
+            self.current_visited = result[6]
+            self.draw_grid(path=self.current_path, visited=self.current_visited)
+            self._add_row(algo, result, cached)
+
+        self._start_job(algo, work, done)
+
+    def _add_row(self, algo, result, cached=False):
+        """cached: sonuç route cache'ten geldiyse süre sütununda işaretlenir."""
+        path, cost, expanded, runtime, sides, counters = result[:6]
+
+        # Otomatik seçilen motor farklıysa etikette göster (örn. DIJKSTRA/BFS)
+        label = algo.upper()
+        engine = select_engine(algo) if algo in ALGORITHMS else algo
+        if engine != algo:
+            label = f"{label}/{engine.upper()}"
 
         time_ms = round(runtime * 1000, 3)
-        self.table.insert("", "end", values=(algo.upper(), f"{time_ms} ms", expanded, cost))
+        # önbellekten gelen satırda süre, sonucu ilk hesaplayan çalıştırmanındır
+        time_text = f"{time_ms} ms (cached)" if cached else f"{time_ms} ms"
+        self.table.insert("", "end", values=(
+            label, time_text, expanded, cost, sides,
+            counters["pushes"], counters["stale_pops"], counters["peak_open"]
+        ))
+
+    def _update_cache_label(self):
+        cache = self.route_cache
+        self.cache_var.set(f"Route cache: {cache.hits} hits / {cache.misses} misses "
+                           f"({len(cache)}/{cache.maxsize})")
 
     def show_path(self):
+        if self._refuse_if_busy():
+            return
         if self.current_path is None:
             messagebox.showinfo("Info", "No path computed yet.")
         else:
-            self.draw_grid(path=self.current_path)
+            self.draw_grid(path=self.current_path, visited=self.current_visited)
 
     def dynamic_update(self):
+        if self._refuse_if_busy():
+            return
         if self.algo_var.get() != "dstar":
             messagebox.showinfo("Info", "Dynamic update only works with D*")
             return
@@ -193,16 +305,197 @@ class RoutePlannerGUI:
 
         old = self.gridmap.grid[r][c]
         new = 1 - old
-        self.gridmap.grid[r][c] = new
+        planner = self.dstar_planner
+
+        def work():
+            # D* Lite grid'i kendisi günceller (gridmap.grid ile aynı dizi);
+            # önceden yazılırsa update_cell değişiklik görmez ve yeniden planlamaz.
+            # Yeniden planlama update_cell içinde yapılır: ilerleme / iptal için
+            # aynı Stats ona da verilir
+            stats = self._progress_stats()
+            planner.update_cell((r, c), new, stats)
+            return planner.find_path(stats)
+
+        def done(result):
+            path = result[0]
+            if path:
+                self.current_path = path
+                self.current_visited = None
+                self.draw_grid(path=path)
+            self._update_cache_label()
+            messagebox.showinfo("Dynamic Update", f"Cell ({r},{c}) changed {old}->{new}")
+
+        self._start_job("D* update", work, done)
 
-        expanded = self.dstar_planner.update_cell((r, c), new)
-        path, cost, expanded2, runtime, _ = self.dstar_planner.find_path()
+    # -------------------------------------------------------
+    # BACKGROUND JOBS
+    # -------------------------------------------------------
 
-        if path:
-            self.current_path = path
-            self.draw_grid(path=path)
+    def _refuse_if_busy(self):
+        """Çalışan bir iş varsa kullanıcıyı uyarır ve True döner."""
+        if self.busy:
+            messagebox.showinfo("Busy", "A planner is already running.")
+            return True
+        return False
+
+    def _start_job(self, name, work, on_done):
+        """
+        work() worker thread'de çalışır; dönüş değeri ana thread'de
+        on_done(result) ile işlenir. Aynı anda tek iş çalışır.
+        """
+        if self._refuse_if_busy():
+            return
 
-        messagebox.showinfo("Dynamic Update", f"Cell ({r},{c}) changed {old}->{new}")
+        self.busy = True
+        self.cancel_event.clear()
+        self.progress.configure(mode="determinate", value=0)
+        self.status_var.set(f"{name} running...")
+        self.cancel_btn.configure(state="normal")
+
+        def target():
+            try:
+                self.results.put(("done", on_done, work()))
+            except _Cancelled:
+                self.results.put(("cancelled", None, None))
+            except Exception as e:
+                self.results.put(("error", None, e))
+
+        threading.Thread(target=target, daemon=True).start()
+
+    def _progress_stats(self):
+        """
+        İlerleme bildiren instrument.Stats (hook'lar worker thread'de
+        çağrılır): on_expand PROGRESS_EVERY genişletmede bir, on_report
+        sayaçlar bildirildiğinde (dp her iterasyonda) ilerlemeyi kuyruğa
+        yazar ve iptal istenmişse aramayı _Cancelled ile keser.
+        """
+        total = max(int(np.count_nonzero(self.gridmap.grid == 0)), 1)
+        cancel = self.cancel_event
+        put = self.results.put
+        count = 0
+
+        def report(done):
+            if cancel.is_set():
+                raise _Cancelled()
+            put(("progress", None, min(done / total, 1.0)))
+
+        def on_expand(cell):
+            nonlocal count
+            count += 1
+            if count % PROGRESS_EVERY == 0:
+                report(count)
+
+        def on_report(stats):
+            # on_expand çağırmayan planlayıcılar (dp) yalnızca relaxations bildirir
+            report(max(count, stats.counters["relaxations"]))
+
+        return Stats(on_expand=on_expand, on_report=on_report)
+
+    def cancel_job(self):
+        if self.pool_jobs:
+            # çalışmakta olan süreçler kesilemez; sonuçları yok sayılır
+            for future in self.pool_jobs:
+                future.cancel()
+            self.pool_jobs = {}
+            self._finish_job("Cancelled")
+        elif self.busy:
+            self.cancel_event.set()
+            self.status_var.set("Cancelling...")
+
+    def _finish_job(self, status):
+        self.busy = False
+        self.progress.configure(value=0)
+        self.status_var.set(status)
+        self.cancel_btn.configure(state="disabled")
+
+    def _poll(self):
+        """Worker / process pool sonuçlarını ana thread'de işler."""
+        try:
+            while True:
+                kind, handler, payload = self.results.get_nowait()
+                if kind == "progress":
+                    self.progress.configure(value=payload * 100)
+                elif kind == "done":
+                    self._finish_job("Done")
+                    handler(payload)
+                elif kind == "error":
+                    self._finish_job("Error")
+                    messagebox.showerror("Error", f"Algo error: {payload}")
+                else:
+                    self._finish_job("Cancelled")
+        except queue.Empty:
+            pass
+
+        if self.pool_jobs:
+            self._poll_pool()
+
+        self.root.after(POLL_MS, self._poll)
+
+    def run_all_parallel(self):
+        """Tüm ALGORITHMS'i process pool'da paralel çalıştırıp karşılaştırır."""
+        if self.gridmap is None:
+            messagebox.showerror("Error", "Generate grid first.")
+            return
+        if self._refuse_if_busy():
+            return
+
+        grid = self.gridmap.grid
+        start = self.gridmap.start
+        goal = self.gridmap.goal
+        heuristic = self.heuristic_var.get()
+        fingerprint = self.gridmap.fingerprint()
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=min(len(ALGORITHMS), os.cpu_count() or 1))
+
+        self.pool_jobs = {}
+        for algo in ALGORITHMS:
+            params = {"heuristic": heuristic} if algo in ("astar", "biastar") else {}
+            key = self.route_cache.make_key(fingerprint, start, goal, algo, params)
+            result = self.route_cache.get(key)
+            if result is not None:
+                self._add_row(algo, result, cached=True)
+                continue
+            future = self.pool.submit(solve, algo, grid, start, goal, heuristic)
+            self.pool_jobs[future] = (algo, key)
+
+        self._update_cache_label()
+        if not self.pool_jobs:
+            self.open_compare_window()
+            return
+
+        self.pool_total = len(self.pool_jobs)
+        self.busy = True
+        self.progress.configure(mode="determinate", value=0)
+        self.status_var.set(f"Running {self.pool_total} planners...")
+        self.cancel_btn.configure(state="normal")
+
+    def _poll_pool(self):
+        for future in [f for f in self.pool_jobs if f.done()]:
+            algo, key = self.pool_jobs.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"{algo} error: {e}")
+                continue
+            self.route_cache.put(key, result)
+            if result[0]:
+                self._add_row(algo, result)
+
+        finished = self.pool_total - len(self.pool_jobs)
+        self.progress.configure(value=100 * finished / self.pool_total)
+        self.status_var.set(f"{finished}/{self.pool_total} planners done")
+
+        if not self.pool_jobs:
+            self._finish_job("Done")
+            self._update_cache_label()
+            self.open_compare_window()
+
+    def _on_close(self):
+        self.cancel_event.set()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     # -------------------------------------------------------
     # COMPARISON WINDOW
@@ -217,12 +510,13 @@ class RoutePlannerGUI:
         win.title("Algorithm Comparison")
         win.geometry("1100x800")
 
-        algos, times, expands, costs = [], [], [], []
+        algos, times, expands, costs, cached = [], [], [], [], []
 
         for row_id in self.table.get_children():
-            algo, t, exp, cost = self.table.item(row_id)["values"]
+            algo, t, exp, cost = self.table.item(row_id)["values"][:4]
             algos.append(algo)
             times.append(float(str(t).split()[0]))
+            cached.append("cached" in str(t))
             expands.append(int(exp))
             costs.append(float(cost))
 
@@ -244,8 +538,9 @@ class RoutePlannerGUI:
         ax = axes[1][1]
         ax.axis("off")
         summary = ""
-        for a, t, e, c in zip(algos, times, expands, costs):
-            summary += f"{a}: {t} ms | {e} expanded | cost={c}\n"
+        for a, t, e, c, hit in zip(algos, times, expands, costs, cached):
+            note = " (cached)" if hit else ""
+            summary += f"{a}: {t} ms{note} | {e} expanded | cost={c}\n"
         ax.text(0.05, 0.5, summary, fontsize=10)
 
         canvas = FigureCanvasTkAgg(fig, master=win)
@@ -255,34 +550,33 @@ class RoutePlannerGUI:
     # -------------------------------------------------------
     # DRAW GRID
     # -------------------------------------------------------
-    def draw_grid(self, path=None):
-        self.ax.clear()
-
+    def draw_grid(self, path=None, visited=None):
         # İlk açılışta grid yoksa, sadece boş beyaz alan çiz
         if self.gridmap is None:
+            self.ax.clear()
+            self.image = None
             self.ax.set_facecolor("white")
             self.ax.set_title("Grid Map (no data yet)")
             self.canvas.draw()
             return
 
+        # engeller, ziyaret edilenler, rota ve uç noktalar tek RGB görüntüde
         grid = self.gridmap.grid
-        self.ax.imshow(grid, cmap="binary")
-
-        # Start / Goal
-        r0, c0 = self.gridmap.start
-        r1, c1 = self.gridmap.goal
-        self.ax.scatter(c0, r0, c="green", s=80)
-        self.ax.scatter(c1, r1, c="red", s=80)
-
-        # Path
-        if path:
-            xs = [c for (r, c) in path]
-            ys = [r for (r, c) in path]
-            self.ax.plot(xs, ys, c="blue", linewidth=2)
-
-        self.ax.set_title("Grid Map")
-        self.ax.invert_yaxis()
-        self.canvas.draw()
+        img = render_rgb(grid, path, visited, self.gridmap.start, self.gridmap.goal,
+                         max_size=MAX_PIXELS)
+        rows, cols = grid.shape
+        extent = (-0.5, cols - 0.5, -0.5, rows - 0.5)
+
+        if self.image is None:
+            self.ax.clear()
+            self.image = self.ax.imshow(img, origin="lower", extent=extent,
+                                        interpolation="nearest")
+            self.ax.set_title("Grid Map")
+        else:
+            self.image.set_data(img)
+            self.image.set_extent(extent)
+
+        self.canvas.draw_idle()
 
 
 # ---------------------------------------------------------
@@ -0,0 +1,303 @@
+"""
+Hiyerarşik yol bulma (HPA*).
+
+Grid, cluster_size x cluster_size boyutlu kümelere bölünür. Komşu iki
+kümenin ortak kenarındaki her boş geçit (entrance) için bir ya da iki
+geçiş (transition) hücre çifti seçilir; bu hücreler soyut grafın
+düğümleridir. Ön hesaplama:
+
+    - kenar geçişleri  -> kümeler arası 1 maliyetli kenarlar
+    - her küme içinde düğümler arası BFS mesafeleri -> küme içi kenarlar
+
+Sorguda start ve goal kendi kümelerine geçici olarak bağlanır, küçük
+soyut grafta A* çalışır, sonra yalnızca yol üzerindeki küme parçaları
+küme içi BFS ile gerçek hücrelere açılır (refinement). Sonuç optimal
+olmayabilir: bench_hpa.py ile (0.2 engel, cluster_size=16, 50 sorgu)
+ortalama ~%1-2 daha uzun yol; en kötü n=1000'de ~%4, n=500'de ~%5,
+n=200'de ~%38 (birkaç kümelik kısa yollarda oran büyür).
+
+update_cell yalnızca hücrenin kümesini ve, hücre küme kenarındaysa,
+geçitleri değişen komşu kümeyi yeniden kurar.
+"""
+
+import heapq
+import time
+
+import numpy as np
+
+from flat_search import FlatGrid, INF, check_trace, _extract_path
+from bucket_search import bfs_tree
+from instrument import lazy_heap_counts
+
+# Bundan uzun geçitlere iki uçtan, kısalara ortadan tek geçiş konur
+MAX_ENTRANCE_WIDTH = 6
+
+
+def heuristic(a, b):
+    return abs(a[0]-b[0]) + abs(a[1]-b[1])  # manhattan
+
+
+class HPAStar:
+    def __init__(self, grid, cluster_size=16):
+        self.grid = grid
+        self.rows, self.cols = grid.shape
+        self.k = int(cluster_size)
+
+        self.crows = -(-self.rows // self.k)
+        self.ccols = -(-self.cols // self.k)
+
+        self.entrances = {}   # (küme_a, küme_b) -> [(hücre_a, hücre_b), ...]
+        self.links = {}       # hücre -> set(komşu kümedeki geçiş hücreleri)
+        self.intra = {}       # küme -> {düğüm: {düğüm: maliyet}}
+
+        t0 = time.perf_counter()
+        for border in self._all_borders():
+            self._set_entrances(border, self._find_entrances(border))
+        for cr in range(self.crows):
+            for cc in range(self.ccols):
+                self._build_cluster((cr, cc))
+        self.build_time = time.perf_counter() - t0
+        self.last_update_time = 0.0
+
+    # ------------------------
+    # CLUSTER / ENTRANCE HELPERS
+    # ------------------------
+
+    def cluster_of(self, cell):
+        return (cell[0] // self.k, cell[1] // self.k)
+
+    def _bounds(self, cl):
+        r0, c0 = cl[0] * self.k, cl[1] * self.k
+        return r0, min(r0 + self.k, self.rows), c0, min(c0 + self.k, self.cols)
+
+    def _all_borders(self):
+        for cr in range(self.crows):
+            for cc in range(self.ccols):
+                if cc + 1 < self.ccols:
+                    yield ((cr, cc), (cr, cc + 1))
+                if cr + 1 < self.crows:
+                    yield ((cr, cc), (cr + 1, cc))
+
+    def _borders_of(self, cl):
+        cr, cc = cl
+        for other in [(cr, cc - 1), (cr, cc + 1), (cr - 1, cc), (cr + 1, cc)]:
+            if 0 <= other[0] < self.crows and 0 <= other[1] < self.ccols:
+                yield (min(cl, other), max(cl, other))
+
+    def _find_entrances(self, border):
+        a, b = border
+        r0, r1, c0, c1 = self._bounds(a)
+        grid = self.grid
+
+        if a[0] == b[0]:
+            # dikey kenar: a'nın son sütunu | b'nin ilk sütunu
+            pairs = [((r, c1 - 1), (r, c1)) for r in range(r0, r1)]
+        else:
+            # yatay kenar: a'nın son satırı / b'nin ilk satırı
+            pairs = [((r1 - 1, c), (r1, c)) for c in range(c0, c1)]
+
+        transitions = []
+        run = []
+        for pa, pb in pairs + [(None, None)]:
+            if pa is not None and grid[pa] == 0 and grid[pb] == 0:
+                run.append((pa, pb))
+                continue
+            if run:
+                if len(run) < MAX_ENTRANCE_WIDTH:
+                    transitions.append(run[len(run) // 2])
+                else:
+                    transitions.append(run[0])
+                    transitions.append(run[-1])
+            run = []
+        return transitions
+
+    def _set_entrances(self, border, transitions):
+        """Geçişleri değiştirir; değiştiyse True döner."""
+        old = self.entrances.get(border, [])
+        if old == transitions:
+            return False
+
+        for pa, pb in old:
+            self.links[pa].discard(pb)
+            self.links[pb].discard(pa)
+        for pa, pb in transitions:
+            self.links.setdefault(pa, set()).add(pb)
+            self.links.setdefault(pb, set()).add(pa)
+        self.entrances[border] = transitions
+        return True
+
+    def _cluster_nodes(self, cl):
+        nodes = set()
+        for border in self._borders_of(cl):
+            for pa, pb in self.entrances.get(border, []):
+                nodes.add(pa if self.cluster_of(pa) == cl else pb)
+        return nodes
+
+    def _cluster_search(self, cl, source, target=None):
+        """
+        Küme sınırları içinde BFS. Returns: (FlatGrid, dist, prev, offset)
+        dist/prev yerel FlatGrid indeksleriyle.
+        """
+        r0, r1, c0, c1 = self._bounds(cl)
+        fg = FlatGrid(self.grid[r0:r1, c0:c1])
+        s = fg.index((source[0] - r0, source[1] - c0))
+        g = -1 if target is None else fg.index((target[0] - r0, target[1] - c0))
+        dist, prev, _, _ = bfs_tree(fg, s, g)
+        return fg, dist, prev, (r0, c0)
+
+    def _distances_in_cluster(self, cl, source, targets):
+        fg, dist, _, (r0, c0) = self._cluster_search(cl, source)
+        out = {}
+        for t in targets:
+            d = dist[fg.index((t[0] - r0, t[1] - c0))]
+            if d < INF and t != source:
+                out[t] = d
+        return out
+
+    def _build_cluster(self, cl):
+        nodes = self._cluster_nodes(cl)
+        self.intra[cl] = {u: self._distances_in_cluster(cl, u, nodes) for u in nodes}
+
+    # ------------------------
+    # QUERY
+    # ------------------------
+
+    def _refine(self, a, b):
+        """Aynı kümedeki a -> b için hücre yolu (a hariç)."""
+        cl = self.cluster_of(a)
+        fg, dist, prev, (r0, c0) = self._cluster_search(cl, a, b)
+        local = _extract_path(fg, prev, fg.index((a[0] - r0, a[1] - c0)),
+                              fg.index((b[0] - r0, b[1] - c0)))
+        return [(r + r0, c + c0) for r, c in local[1:]]
+
+    def find_path(self, start, goal, stats=None, trace="visited"):
+        """
+        stats: opsiyonel instrument.Stats (sayaçlar soyut aramaya aittir;
+               fazlar "insert", "search", "refine")
+        trace: visited biçimi (flat_search.TRACE_MODES), soyut düğümler için
+
+        Returns: path, cost, expanded (soyut düğüm), runtime, visited (soyut düğümler)
+        """
+        t0 = time.perf_counter()
+        order = [] if check_trace(trace) is not None else None
+
+        cs, cg = self.cluster_of(start), self.cluster_of(goal)
+        start_nodes = set(self.intra[cs])
+        if cs == cg:
+            start_nodes.add(goal)
+        start_edges = self._distances_in_cluster(cs, start, start_nodes)
+        goal_edges = self._distances_in_cluster(cg, goal, set(self.intra[cg]))
+
+        t_insert = time.perf_counter()
+
+        g = {start: 0}
+        prev = {}
+        closed = set()
+        expanded = 0
+        pushes = peak = 1
+        reopenings = 0
+        instrumented = stats is not None
+        on_expand = stats.on_expand if instrumented else None
+        record = order.append if order is not None else None
+
+        pq = [(heuristic(start, goal), 0, start)]
+        while pq:
+            f, gcur, u = heapq.heappop(pq)
+            if u in closed:
+                continue
+            closed.add(u)
+            expanded += 1
+            if record is not None:
+                record(u)
+            if on_expand is not None:
+                on_expand(u)
+
+            if u == goal:
+                break
+
+            if u == start:
+                edges = list(start_edges.items())
+            else:
+                edges = list(self.intra[self.cluster_of(u)].get(u, {}).items())
+                if u in goal_edges:
+                    edges.append((goal, goal_edges[u]))
+            edges += [(v, 1) for v in self.links.get(u, ())]
+
+            for v, w in edges:
+                tentative = gcur + w
+                if tentative < g.get(v, INF):
+                    g[v] = tentative
+                    prev[v] = u
+                    heapq.heappush(pq, (tentative + heuristic(v, goal), tentative, v))
+                    pushes += 1
+                    if v in closed:
+                        reopenings += 1
+
+            if instrumented and len(pq) > peak:
+                peak = len(pq)
+
+        t_search = time.perf_counter()
+        if stats is not None:
+            stats.record(**lazy_heap_counts(pushes, len(pq), expanded, peak, reopenings))
+            stats.add_time("insert", t_insert - t0)
+            stats.add_time("search", t_search - t_insert)
+
+        if trace == "counts":
+            visited = len(closed)
+        elif trace == "order":
+            visited = np.array(order, dtype=np.int32).reshape(-1, 2)
+        else:
+            visited = closed if trace == "visited" else None
+
+        if start == goal:
+            return [start], 0, expanded, time.perf_counter() - t0, visited
+        if goal not in g:
+            return None, None, expanded, time.perf_counter() - t0, visited
+
+        abstract = [goal]
+        while abstract[-1] != start:
+            abstract.append(prev[abstract[-1]])
+        abstract.reverse()
+
+        path = [start]
+        for a, b in zip(abstract, abstract[1:]):
+            if self.cluster_of(a) != self.cluster_of(b):
+                path.append(b)  # kümeler arası geçiş
+            else:
+                path.extend(self._refine(a, b))
+
+        runtime = time.perf_counter() - t0
+        if stats is not None:
+            stats.add_time("refine", t0 + runtime - t_search)
+        return path, g[goal], expanded, runtime, visited
+
+    # ------------------------
+    # DYNAMIC UPDATE
+    # ------------------------
+
+    def update_cell(self, cell, new_state):
+        """
+        Hücreyi değiştirir ve yalnızca etkilenen kümeleri yeniden kurar.
+        Returns: yeniden kurulan küme sayısı
+        """
+        t0 = time.perf_counter()
+
+        if self.grid[cell] == new_state:
+            return 0
+        self.grid[cell] = new_state
+
+        cl = self.cluster_of(cell)
+        dirty = {cl}
+        r0, r1, c0, c1 = self._bounds(cl)
+        on_edge = cell[0] in (r0, r1 - 1) or cell[1] in (c0, c1 - 1)
+
+        if on_edge:
+            for border in self._borders_of(cl):
+                if self._set_entrances(border, self._find_entrances(border)):
+                    dirty.update(border)
+
+        for c in dirty:
+            self._build_cluster(c)
+
+        self.last_update_time = time.perf_counter() - t0
+        return len(dirty)
@@ -0,0 +1,101 @@
+class IndexedHeap:
+    """
+    Konum indeksli binary min-heap.
+
+    Her öğe kuyrukta en fazla bir kez bulunur; öğenin heap içindeki yeri
+    bir dict'te tutulduğundan update (decrease/increase-key), remove ve
+    contains O(log n) / O(1) çalışır. Eski (stale) kayıt birikmez.
+
+    Kayıtlar (key, item) tuple'larıdır; eşit key'lerde item karşılaştırılır.
+    """
+    def __init__(self):
+        self._heap = []
+        self._pos = {}
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, item):
+        return item in self._pos
+
+    def contains(self, item):
+        return item in self._pos
+
+    def top(self):
+        """En küçük (key, item); kuyruk boşsa IndexError."""
+        return self._heap[0]
+
+    def top_key(self, default=None):
+        return self._heap[0][0] if self._heap else default
+
+    def push(self, item, key):
+        """Öğe yoksa ekler, varsa key'ini günceller."""
+        if item in self._pos:
+            self.update(item, key)
+            return
+
+        self._heap.append((key, item))
+        self._pos[item] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+        if len(self._heap) > self.peak_size:
+            self.peak_size = len(self._heap)
+
+    def update(self, item, key):
+        i = self._pos[item]
+        old = self._heap[i][0]
+        self._heap[i] = (key, item)
+        if key < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, item):
+        i = self._pos.pop(item)
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._pos[last[1]] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last[1]])
+
+    def pop(self):
+        entry = self._heap[0]
+        self.remove(entry[1])
+        return entry
+
+    # ------------------------
+    # HEAP HELPERS
+    # ------------------------
+
+    def _sift_up(self, i):
+        heap, pos = self._heap, self._pos
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i][1]] = i
+            i = parent
+        heap[i] = entry
+        pos[entry[1]] = i
+
+    def _sift_down(self, i):
+        heap, pos = self._heap, self._pos
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[i] = heap[child]
+            pos[heap[i][1]] = i
+            i = child
+        heap[i] = entry
+        pos[entry[1]] = i
@@ -0,0 +1,79 @@
+"""
+Planlayıcılar için ortak ölçüm (instrumentation) arayüzü.
+
+Planlayıcılar opsiyonel bir `stats=None` argümanı alır. Sayaçlar arama
+döngüsünde yerel değişkenlerde tutulur ve arama bitince tek seferde
+record() ile bildirilir; stats verilmediğinde ek maliyet birkaç yerel
+tamsayı artırımından ibarettir.
+
+Sayaçlar (planlayıcıya göre anlamları):
+    pushes       open listesine eklenen kayıt (key güncellemeleri dahil)
+    pops         open listesinden çıkarılan kayıt
+    stale_pops   çıkarıldığında geçersiz olan kayıt (kapalı düğüm / eski key)
+    relaxations  başarılı kenar gevşetmeleri (mesafe / rhs iyileşmesi)
+    reopenings   kapalı bir düğümün yeniden açılması
+    peak_open    open listesinin en büyük boyutu
+
+Fazlar (timers=True): "search", "extract" ve planlayıcıya özgü diğerleri
+(örn. D* Lite "update", HPA* "insert" / "refine").
+
+Hook'lar:
+    on_expand(cell)  her genişletmede; yalnızca verildiğinde çağrılır
+    on_report(stats) planlayıcı sayaçlarını bildirdiğinde
+
+    stats = Stats()
+    run_planner("astar", grid, start, goal, stats=stats)
+    stats.as_dict()
+"""
+
+COUNTERS = ("pushes", "pops", "stale_pops", "relaxations", "reopenings", "peak_open")
+
+
+class Stats:
+    def __init__(self, timers=True, on_expand=None, on_report=None):
+        self.timers = timers
+        self.on_expand = on_expand
+        self.on_report = on_report
+        self.reset()
+
+    def reset(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.phases = {}
+
+    def record(self, **counts):
+        """Sayaçları ekler; peak_open için en büyük değer tutulur."""
+        counters = self.counters
+        for name, value in counts.items():
+            if name == "peak_open":
+                counters[name] = max(counters.get(name, 0), value)
+            else:
+                counters[name] = counters.get(name, 0) + value
+
+        if self.on_report is not None:
+            self.on_report(self)
+
+    def add_time(self, phase, seconds):
+        if self.timers:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def __getitem__(self, name):
+        return self.counters[name]
+
+    def as_dict(self):
+        """Sayaçlar + faz süreleri ("<faz>_ms") tek sözlükte."""
+        out = dict(self.counters)
+        for phase, seconds in self.phases.items():
+            out[f"{phase}_ms"] = round(seconds * 1000, 3)
+        return out
+
+
+def lazy_heap_counts(pushes, left, expanded, peak_open, reopenings=0, roots=1):
+    """
+    Tembel silmeli (lazy deletion) heap kullanan aramalar için sayaçlar.
+    Her kayıt ya çıkarılmış ya da kuyrukta kalmıştır: pops = pushes - left;
+    genişletilmeyen her pop stale'dir. Kök dışındaki her push bir gevşetmedir.
+    """
+    pops = pushes - left
+    return {"pushes": pushes, "pops": pops, "stale_pops": pops - expanded,
+            "relaxations": pushes - roots, "reopenings": reopenings,
+            "peak_open": peak_open}
@@ -0,0 +1,265 @@
+"""
+4-komşulu grid için Jump Point Search (JPS) ve JPS+.
+
+Boş alanlarda A*, aynı maliyetli simetrik yol öneklerinin hemen hepsini
+heap'e koyar. JPS düz çizgiler boyunca "atlar" ve yalnızca zorunlu
+komşusu olan (forced neighbor) hücrelerde durur; A* bu jump point'ler
+üzerinde çalışır. Kurallar (4-komşulu sürüm):
+
+    - Yatay hareket: (x±W) boş ve (x-d±W) engel ise x jump point
+    - Dikey hareket: (x±1) boş ve (x-d±1) engel ise x jump point;
+      ayrıca x'ten sağa/sola yatay atlama bir jump point bulursa
+    - Yatay gelinen düğümden: yukarı, aşağı, ileri
+      Dikey gelinen düğümden : sol, sağ, ileri
+
+JPS+ (build_jps_table): statik grid için her hücre ve 4 yön için
+"sonraki jump point'e uzaklık (>0) / duvara kadar boş adım sayısı (<=0)"
+tablosu bir kez vektörize hesaplanır; arama sırasında tarama yapılmaz.
+
+Sonuç maliyeti A* ile aynıdır; expanded = açılan jump point sayısı.
+"""
+
+import heapq
+import time
+from array import array
+
+import numpy as np
+
+from flat_search import INF, as_flat, check_trace
+from instrument import lazy_heap_counts
+
+
+class JPSTable:
+    """
+    build_jps_table çıktısı. dist[k][idx]: FlatGrid.offsets[k] yönünde
+    >0 ise o kadar adım sonra jump point, <=0 ise -değer adım sonra duvar.
+    """
+    def __init__(self, fg, dist):
+        self.fg = fg
+        self.dist = dist
+
+
+def _next_event(events):
+    """
+    events: (R, L) bool. Her (r, i) için i'den SONRA gelen ilk event'in
+    indeksi (satır boyunca sağa doğru). Kenar dolgusu sayesinde her zaman var.
+    """
+    L = events.shape[1]
+    pos = np.where(events, np.arange(L), L)
+    nxt = np.minimum.accumulate(pos[:, ::-1], axis=1)[:, ::-1]
+    out = np.full_like(nxt, L)
+    out[:, :-1] = nxt[:, 1:]
+    return out
+
+
+def _scan(blocked, jump):
+    """Satır boyunca sağa doğru tablo değerleri (bkz. JPSTable)."""
+    nxt = _next_event(blocked | jump)
+    nxt = np.minimum(nxt, blocked.shape[1] - 1)
+    steps = nxt - np.arange(blocked.shape[1])
+    is_jump = np.take_along_axis(jump, nxt, axis=1)
+    return np.where(is_jump, steps, -(steps - 1))
+
+
+def build_jps_table(grid):
+    """
+    JPS+ ön hesaplaması (vektörize). Grid değişirse yeniden kurulmalı.
+
+    Returns: JPSTable
+    """
+    fg = as_flat(grid)
+    B = np.frombuffer(bytes(fg.blocked), dtype=np.uint8).reshape(fg.rows + 2, fg.width).astype(bool)
+    F = ~B
+
+    def shift(a, dr, dc, fill):
+        # out[r, c] = a[r+dr, c+dc]
+        out = np.full_like(a, fill)
+        R, C = a.shape
+        out[max(0, -dr):R - max(0, dr), max(0, -dc):C - max(0, dc)] = \
+            a[max(0, dr):R + min(0, dr), max(0, dc):C + min(0, dc)]
+        return out
+
+    # Yatay jump point'ler: sağa (d=+1) gelirken ve sola (d=-1) gelirken
+    jump_right = F & ((shift(F, 1, 0, False) & shift(B, 1, -1, True)) |
+                      (shift(F, -1, 0, False) & shift(B, -1, -1, True)))
+    jump_left = F & ((shift(F, 1, 0, False) & shift(B, 1, 1, True)) |
+                     (shift(F, -1, 0, False) & shift(B, -1, 1, True)))
+
+    right = _scan(B, jump_right)
+    left = _scan(B[:, ::-1], jump_left[:, ::-1])[:, ::-1]
+    horizontal_hit = (right > 0) | (left > 0)
+
+    # Dikey jump point'ler: zorunlu komşu ya da yatay taramanın bulduğu jump point
+    jump_down = F & ((shift(F, 0, 1, False) & shift(B, -1, 1, True)) |
+                     (shift(F, 0, -1, False) & shift(B, -1, -1, True)) |
+                     horizontal_hit)
+    jump_up = F & ((shift(F, 0, 1, False) & shift(B, 1, 1, True)) |
+                   (shift(F, 0, -1, False) & shift(B, 1, -1, True)) |
+                   horizontal_hit)
+
+    down = _scan(B.T, jump_down.T).T
+    up = _scan(B[::-1].T, jump_up[::-1].T).T[::-1]
+
+    dist = []
+    for tbl in (down, up, right, left):  # FlatGrid.offsets sırası: +W, -W, +1, -1
+        tbl = np.where(B, 0, tbl).astype(np.int32)
+        dist.append(array("i", tbl.tobytes()))
+    return JPSTable(fg, dist)
+
+
+def _jump_h(blocked, W, x, d, g):
+    while True:
+        if blocked[x]:
+            return -1
+        if x == g:
+            return x
+        if (not blocked[x + W] and blocked[x - d + W]) or (not blocked[x - W] and blocked[x - d - W]):
+            return x
+        x += d
+
+
+def _jump_v(blocked, W, x, d, g):
+    while True:
+        if blocked[x]:
+            return -1
+        if x == g:
+            return x
+        if (not blocked[x + 1] and blocked[x - d + 1]) or (not blocked[x - 1] and blocked[x - d - 1]):
+            return x
+        if _jump_h(blocked, W, x + 1, 1, g) >= 0 or _jump_h(blocked, W, x - 1, -1, g) >= 0:
+            return x
+        x += d
+
+
+def _directions(W, d_in):
+    if d_in == 0:
+        return (W, -W, 1, -1)
+    if d_in in (1, -1):
+        return (W, -W, d_in)
+    return (1, -1, d_in)
+
+
+def jps(grid, start, goal, table=None, stats=None, trace="visited"):
+    """
+    grid: numpy array (0 boş, 1 engel) ya da FlatGrid
+    table: opsiyonel JPSTable (JPS+). Verilirse grid yerine table.fg kullanılır.
+    stats: opsiyonel instrument.Stats
+    trace: visited biçimi (flat_search.TRACE_MODES); hücreler jump point'lerdir
+
+    Returns: path, cost, expanded, runtime, visited (açılan jump point'ler)
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    fg = table.fg if table is not None else as_flat(grid)
+    blocked = fg.blocked
+    W = fg.width
+
+    s = fg.index(start)
+    g = fg.index(goal)
+    gr, gc = divmod(g, W)
+    slot = {W: 0, -W: 1, 1: 2, -1: 3}
+
+    def h(v):
+        r, c = divmod(v, W)
+        return abs(r - gr) + abs(c - gc)
+
+    def successor(u, d):
+        """u'dan d yönünde atlanan jump point ve adım sayısı; yoksa (-1, 0)."""
+        if table is None:
+            v = _jump_h(blocked, W, u + d, d, g) if d in (1, -1) else _jump_v(blocked, W, u + d, d, g)
+            if v < 0:
+                return -1, 0
+            return v, abs(v - u) if d in (1, -1) else abs(v - u) // W
+
+        val = table.dist[slot[d]][u]
+        reach = val if val > 0 else -val
+        ur, uc = divmod(u, W)
+        if d in (1, -1):
+            k = (gc - uc) * d
+            if ur == gr and 0 < k <= reach:
+                return g, k
+        else:
+            k = (gr - ur) * (1 if d > 0 else -1)
+            if 0 < k <= reach:
+                return u + k * d, k
+        if val > 0:
+            return u + val * d, val
+        return -1, 0
+
+    gcost = {s: 0}
+    parent = {}
+    arrived = {s: 0}  # düğüme hangi yönden gelindi
+    closed = set()
+    expanded = 0
+    pushes = peak = 1
+    reopenings = 0
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+    record = order.append if order is not None else None
+
+    pq = [(h(s), 0, s)]
+    while pq:
+        f, gcur, u = heapq.heappop(pq)
+        if u in closed:
+            continue
+
+        closed.add(u)
+        expanded += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(fg.cell(u))
+
+        if u == g:
+            break
+
+        for d in _directions(W, arrived[u]):
+            if blocked[u + d]:
+                continue
+            v, k = successor(u, d)
+            if v < 0:
+                continue
+            tentative = gcur + k
+            if tentative < gcost.get(v, INF):
+                gcost[v] = tentative
+                parent[v] = u
+                arrived[v] = d
+                heapq.heappush(pq, (tentative + h(v), tentative, v))
+                pushes += 1
+                if v in closed:
+                    reopenings += 1
+
+        if instrumented and len(pq) > peak:
+            peak = len(pq)
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = gcost.get(g)
+    if cost is not None:
+        # jump point'ler arası düz doğru parçalarını hücrelere aç
+        cur = g
+        while cur != s:
+            p = parent[cur]
+            step = arrived[cur]
+            while cur != p:
+                path.append(fg.cell(cur))
+                cur -= step
+        path.append(fg.cell(s))
+        path.reverse()
+    if trace == "visited":
+        visited = {fg.cell(v) for v in closed}
+    elif trace == "counts":
+        visited = len(closed)
+    elif trace == "order":
+        visited = fg.cell_array(order)
+    else:
+        visited = None
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.record(**lazy_heap_counts(pushes, len(pq), expanded, peak, reopenings))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited
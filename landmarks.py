@@ -0,0 +1,173 @@
+"""
+ALT (A*, Landmarks, Triangle inequality) sezgisi.
+
+manhattan / euclidean / chebyshev engelleri hiç görmez; labirent benzeri
+haritalarda A*, Dijkstra'dan pek az daha az iş yapar. Burada K adet
+landmark seçilir ve her birinden tüm grid'e BFS mesafesi bir kez
+hesaplanır. Üçgen eşitsizliğinden:
+
+    h(v, goal) = max_L |d(L, goal) - d(L, v)|   <= d(v, goal)
+
+Sezgi kabul edilebilir (admissible) ve tutarlıdır. Tablolar uint16
+(yetmezse int32) olarak saklanır; erişilemeyen hücreler dtype'ın en büyük
+değeridir. load_or_build tabloları grid parmak izine göre diske yazar,
+böylece ön hesaplama harita başına bir kez yapılır.
+"""
+
+import os
+import tempfile
+from array import array
+
+import numpy as np
+
+from grid import grid_fingerprint
+from flat_search import INF, FlatGrid
+from bucket_search import bfs_tree
+
+
+def _distance_field(fg, cell):
+    """cell'den BFS mesafeleri, (rows, cols) int32; erişilemez = INF."""
+    dist, _, _, _ = bfs_tree(fg, fg.index(cell))
+    padded = np.frombuffer(dist, dtype=np.int32).reshape(fg.rows + 2, fg.width)
+    return padded[1:-1, 1:-1].copy()
+
+
+def _select_corners(grid, k):
+    """Köşelere (sonra kenar ortalarına) en yakın boş hücreler."""
+    rows, cols = grid.shape
+    anchors = [(0, 0), (rows - 1, cols - 1), (0, cols - 1), (rows - 1, 0),
+               (0, cols // 2), (rows - 1, cols // 2), (rows // 2, 0), (rows // 2, cols - 1)]
+
+    free = np.argwhere(grid == 0)
+    chosen = []
+    for ar, ac in anchors:
+        i = int(np.argmin(np.abs(free[:, 0] - ar) + np.abs(free[:, 1] - ac)))
+        cell = (int(free[i, 0]), int(free[i, 1]))
+        if cell not in chosen:
+            chosen.append(cell)
+        if len(chosen) == k:
+            break
+    return chosen
+
+
+def _select_farthest(fg, grid, k):
+    """Farthest-point: her yeni landmark, seçilenlere en uzak erişilebilir hücre."""
+    free = np.argwhere(grid == 0)
+    seed = (int(free[0, 0]), int(free[0, 1]))
+
+    d = _distance_field(fg, seed)
+    d = np.where(d < INF, d, -1)
+    first = np.unravel_index(int(np.argmax(d)), d.shape)
+
+    chosen = [(int(first[0]), int(first[1]))]
+    fields = [_distance_field(fg, chosen[0])]
+    nearest = fields[0].copy()
+
+    while len(chosen) < k:
+        score = np.where(nearest < INF, nearest, -1)
+        nxt = np.unravel_index(int(np.argmax(score)), score.shape)
+        if score[nxt] <= 0:
+            break
+        chosen.append((int(nxt[0]), int(nxt[1])))
+        fields.append(_distance_field(fg, chosen[-1]))
+        nearest = np.minimum(nearest, fields[-1])
+    return chosen, fields
+
+
+class LandmarkTable:
+    """
+    landmarks: [(r, c), ...]
+    dist: (K, rows, cols) uint16 / int32 mesafe tabloları
+    """
+    def __init__(self, landmarks, dist, fingerprint):
+        self.landmarks = [tuple(int(x) for x in lm) for lm in landmarks]
+        self.dist = dist
+        self.fingerprint = fingerprint
+        self.unreachable = np.iinfo(dist.dtype).max
+        self._padded = {}
+
+    def heuristic(self, a, b):
+        """Tuple tabanlı astar.heuristic_fn için: h(a, b)."""
+        da = self.dist[:, a[0], a[1]].astype(np.int64)
+        db = self.dist[:, b[0], b[1]].astype(np.int64)
+        ok = db != self.unreachable
+        if not ok.any():
+            return 0
+        return int(np.max(np.abs(da[ok] - db[ok])))
+
+    def padded(self, fg):
+        """
+        fg'nin düz indekslemesine göre landmark başına diziler (önbellekli).
+        fg: FlatGrid (1 hücre dolgu) ya da graph_index.GridGraph (dolgusuz)
+        """
+        key = (fg.rows, fg.width)
+        if key not in self._padded:
+            code = "H" if self.dist.dtype == np.uint16 else "i"
+            pad = (fg.width - fg.cols) // 2
+            tables = []
+            for d in self.dist:
+                p = np.full((fg.rows + 2 * pad, fg.width), self.unreachable,
+                            dtype=self.dist.dtype)
+                p[pad:pad + fg.rows, pad:pad + fg.cols] = d
+                tables.append(array(code, p.tobytes()))
+            self._padded[key] = tables
+        return self._padded[key]
+
+    def save(self, path):
+        np.savez_compressed(path, landmarks=np.array(self.landmarks, dtype=np.int32),
+                            dist=self.dist, fingerprint=np.array(self.fingerprint))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["landmarks"], data["dist"], str(data["fingerprint"]))
+
+
+def build_landmarks(grid, k=8, method="farthest"):
+    """
+    grid: numpy array (0 boş, 1 engel)
+    method: "farthest" | "corners"
+    """
+    grid = np.asarray(grid)
+    fg = FlatGrid(grid)
+
+    if method == "corners":
+        chosen = _select_corners(grid, k)
+        fields = [_distance_field(fg, lm) for lm in chosen]
+    elif method == "farthest":
+        chosen, fields = _select_farthest(fg, grid, k)
+    else:
+        raise ValueError(f"Unknown landmark method: {method}")
+
+    stacked = np.stack(fields)
+    reachable = stacked < INF
+    max_d = int(stacked[reachable].max()) if reachable.any() else 0
+    dtype = np.uint16 if max_d < np.iinfo(np.uint16).max else np.int32
+    dist = np.where(reachable, stacked, np.iinfo(dtype).max).astype(dtype)
+
+    return LandmarkTable(chosen, dist, grid_fingerprint(grid))
+
+
+def load_or_build(grid, k=8, method="farthest", cache_dir=".landmarks"):
+    """Aynı grid için daha önce kaydedilmiş tablo varsa onu yükler."""
+    fp = grid_fingerprint(grid)
+    path = os.path.join(cache_dir, f"{fp}_{method}_k{k}.npz")
+
+    if os.path.exists(path):
+        table = LandmarkTable.load(path)
+        if table.fingerprint == fp:
+            return table
+
+    table = build_landmarks(grid, k, method)
+    os.makedirs(cache_dir, exist_ok=True)
+    # aynı tabloyu paralel kuran süreçler yarım yazılmış dosya okumasın:
+    # önce aynı dizinde geçici dosyaya, sonra atomik olarak yerine
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            table.save(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return table
@@ -0,0 +1,134 @@
+"""
+Ortak planlayıcı girişi: algoritma adı + grid + start/goal -> sonuç tuple'ı.
+
+Dijkstra isteğinde motor, maliyetlere göre otomatik seçilir:
+
+    cost_grid None (her adım 1)                -> bfs   (deque)
+    tamsayı ve 0 <= maliyet <= DIAL_MAX_WEIGHT -> dial  (bucket kuyruğu)
+    daha büyük tamsayı maliyetler              -> dijkstra (heap)
+
+Tüm motorlar aynı optimal maliyeti verir; yalnızca genişletme sırası
+(ve dolayısıyla expanded / visited) eşitlik durumlarında farklı olabilir.
+D* Lite durum tuttuğu için (DStarLite) burada değil.
+
+components (components.ComponentIndex) verilirse start ile goal farklı
+bileşendeyse arama hiç başlatılmadan O(1) "yol yok" döner.
+
+graph (graph_index.GridGraph) verilirse dijkstra / astar komşuları CSR
+indeksinden okur (graph_search); indeks sorgular arasında paylaşılır.
+
+grid bir tiled_grid.TiledGrid ise birim maliyetli dijkstra / astar
+tiled_search ile parçalar üzerinden çözülür (harita tümüyle açılmaz);
+heuristic="alt" ise landmark tablosu zaten tüm haritayı kapsadığından
+normal A* motoru kullanılır.
+"""
+
+import time
+
+import numpy as np
+
+from flat_search import check_trace, dijkstra_flat, astar_flat
+from bucket_search import bfs_shortest_path, dial_shortest_path
+from dp_path import dp_shortest_path
+from bidirectional import bidirectional_dijkstra, bidirectional_astar
+from jps import jps
+from tiled_grid import TiledGrid, tiled_search
+from graph_index import graph_search
+
+DIAL_MAX_WEIGHT = 255
+
+ALGORITHMS = ["dijkstra", "astar", "dp", "bidijkstra", "biastar", "jps"]
+
+
+def select_engine(algo, cost_grid=None):
+    """algo için kullanılacak motorun adını döner."""
+    if algo != "dijkstra":
+        return algo
+
+    if cost_grid is None:
+        return "bfs"
+
+    cost_grid = np.asarray(cost_grid)
+    if not np.issubdtype(cost_grid.dtype, np.integer):
+        raise ValueError("cost_grid must contain integer costs")
+    if cost_grid.size and cost_grid.min() < 0:
+        raise ValueError("cost_grid must be non-negative")
+
+    if cost_grid.size == 0 or cost_grid.max() <= DIAL_MAX_WEIGHT:
+        return "dial"
+    return "dijkstra"
+
+
+def _empty_trace(trace):
+    check_trace(trace)
+    if trace == "visited":
+        return set()
+    if trace == "counts":
+        return 0
+    if trace == "order":
+        return np.empty((0, 2), dtype=np.int32)
+    return None
+
+
+def run_planner(algo, grid, start, goal, heuristic="manhattan", cost_grid=None,
+                landmarks=None, components=None, stats=None, trace="visited", graph=None):
+    """
+    algo: "dijkstra" | "astar" | "dp" | "bidijkstra" | "biastar" | "jps"
+    cost_grid: opsiyonel hücreye girme maliyetleri (yalnızca dijkstra)
+    landmarks: heuristic="alt" için landmarks.LandmarkTable
+    components: opsiyonel components.ComponentIndex (grid ile güncel olmalı)
+    stats: opsiyonel instrument.Stats; seçilen motor sayaçlarını buna bildirir
+    trace: visited biçimi, flat_search.TRACE_MODES
+           ("visited" | "counts" | "order" | "none")
+    graph: opsiyonel graph_index.GridGraph (grid ile güncel olmalı);
+           dijkstra / astar için kullanılır. Kenar ağırlıkları yalnızca
+           dijkstra'ya cost_grid verildiğinde okunur; graf o zaman aynı
+           maliyetlerle ağırlıklı kurulmuş olmalı.
+
+    Returns: path, cost, expanded, runtime, visited
+    """
+    engine = select_engine(algo, cost_grid)
+
+    if components is not None:
+        t0 = time.perf_counter()
+        if not components.connected(start, goal):
+            return [], None, 0, time.perf_counter() - t0, _empty_trace(trace)
+
+    if graph is not None and engine in ("bfs", "dial", "dijkstra", "astar"):
+        if engine == "astar" and cost_grid is not None:
+            raise ValueError(f"{algo} only supports unit costs")
+        return graph_search(graph, start, goal, heuristic if engine == "astar" else None,
+                            landmarks, stats, trace, weighted=cost_grid is not None)
+
+    # ALT tabloları zaten tüm harita boyutunda: tiled_search yerine normal motor
+    if (isinstance(grid, TiledGrid) and engine in ("bfs", "astar")
+            and not (engine == "astar" and heuristic == "alt")):
+        return tiled_search(grid, start, goal, heuristic if engine == "astar" else None,
+                            stats, trace)
+
+    if engine == "bfs":
+        return bfs_shortest_path(grid, start, goal, stats, trace)
+    if engine == "dial":
+        return dial_shortest_path(grid, start, goal, cost_grid, stats, trace)
+    if engine == "dijkstra":
+        return dijkstra_flat(grid, start, goal, cost_grid, stats, trace)
+
+    if cost_grid is not None:
+        raise ValueError(f"{algo} only supports unit costs")
+
+    if engine == "astar":
+        return astar_flat(grid, start, goal, heuristic, landmarks, stats, trace)
+    if engine == "dp":
+        return dp_shortest_path(grid, start, goal, stats=stats, trace=trace)
+
+    if engine == "jps":
+        return jps(grid, start, goal, stats=stats, trace=trace)
+
+    # Çift yönlü sürümlerin taraf başına sayıları burada atılır;
+    # ihtiyaç olursa bidirectional.py doğrudan çağrılmalı.
+    if engine == "bidijkstra":
+        return bidirectional_dijkstra(grid, start, goal, stats, trace)[:5]
+    if engine == "biastar":
+        return bidirectional_astar(grid, start, goal, heuristic, landmarks, stats, trace)[:5]
+
+    raise ValueError(f"Unknown algorithm: {algo}")
@@ -0,0 +1,114 @@
+"""
+Grid / rota / ziyaret edilen hücreler için hızlı raster çizim.
+
+matplotlib'de imshow + scatter + plot her çizimde yeni artist'ler
+oluşturur; büyük gridlerde saniyeler sürer. render_rgb tüm katmanları
+tek bir hücre kodu dizisinde birleştirip palet üzerinden (h, w, 3) uint8
+RGB görüntüye çevirir; görüntü Tk'da tek bir AxesImage'a set_data ile,
+Streamlit'te doğrudan st.image ile verilir.
+
+Katman öncelikleri (küçültmede blok içindeki en yüksek kod kazanır,
+böylece ince rota / engeller önizlemede kaybolmaz):
+    FREE < VISITED < OBSTACLE < PATH < START < GOAL
+
+    img = render_rgb(gm.grid, path, visited, gm.start, gm.goal, max_size=800)
+"""
+
+import math
+
+import numpy as np
+
+FREE, VISITED, OBSTACLE, PATH, START, GOAL = range(6)
+
+# kod sırasıyla renkler
+PALETTE = np.array([
+    (255, 255, 255),  # FREE
+    (173, 216, 230),  # VISITED
+    (0, 0, 0),        # OBSTACLE
+    (30, 80, 255),    # PATH
+    (0, 170, 0),      # START
+    (220, 0, 0),      # GOAL
+], dtype=np.uint8)
+
+
+def _cells(cells):
+    """hücre kümesi / listesi / (k, 2) dizi -> (rows, cols) indeks dizileri; boşsa None."""
+    if isinstance(cells, (set, frozenset)):
+        cells = list(cells)
+    arr = np.asarray(cells, dtype=np.int64)
+    if arr.size == 0:
+        return None
+    arr = arr.reshape(-1, 2)
+    return arr[:, 0], arr[:, 1]
+
+
+def downsample_factor(shape, max_size=None):
+    """En uzun kenarı max_size'a indiren tamsayı blok boyutu (en az 1)."""
+    if not max_size:
+        return 1
+    return max(1, math.ceil(max(shape) / max_size))
+
+
+def render_codes(grid, path=None, visited=None, factor=1):
+    """
+    Hücre kodları (FREE..PATH); factor > 1 ise factor x factor bloklar
+    en yüksek öncelikli kodla tek piksele indirilir.
+
+    visited: hücre kümesi / listesi, (k, 2) dizi ya da grid boyutunda bool maske.
+             Sayı ya da None (trace="counts" / "none") yok sayılır.
+    """
+    grid = np.asarray(grid)
+    codes = np.where(grid != 0, OBSTACLE, FREE).astype(np.uint8)
+
+    if isinstance(visited, np.ndarray) and visited.dtype == bool:
+        codes[visited & (codes == FREE)] = VISITED
+    elif visited is not None and not np.isscalar(visited):
+        idx = _cells(visited)
+        if idx is not None:
+            # engel kodunun üstüne yazılmaz
+            codes[idx] = np.maximum(codes[idx], VISITED)
+
+    if path:
+        idx = _cells(path)
+        if idx is not None:
+            codes[idx] = PATH
+
+    if factor > 1:
+        rows, cols = codes.shape
+        pr, pc = -rows % factor, -cols % factor
+        if pr or pc:
+            codes = np.pad(codes, ((0, pr), (0, pc)), constant_values=FREE)
+        r, c = codes.shape
+        codes = codes.reshape(r // factor, factor, c // factor, factor).max(axis=(1, 3))
+
+    return codes
+
+
+def render_rgb(grid, path=None, visited=None, start=None, goal=None, max_size=None,
+               marker=None):
+    """
+    grid: (rows, cols) dizi (0 boş, 1 engel)
+    path: hücre listesi ya da (k, 2) dizi
+    visited: bkz. render_codes
+    start, goal: (r, c); marker yarıçaplı kare olarak çizilir
+    max_size: en uzun kenar bundan büyükse blok halinde küçültülür
+    marker: uç nokta işaretinin piksel yarıçapı; None ise görüntü
+            boyutunun ~%1'i
+
+    Returns: (h, w, 3) uint8 RGB görüntü; piksel (i, j) hücre
+             (i*factor, j*factor) bloğudur (factor = downsample_factor)
+    """
+    factor = downsample_factor(np.shape(grid), max_size)
+    codes = render_codes(grid, path, visited, factor)
+
+    h, w = codes.shape
+    if marker is None:
+        marker = max(h, w) // 100
+
+    for cell, code in ((start, START), (goal, GOAL)):
+        if cell is None:
+            continue
+        r, c = cell[0] // factor, cell[1] // factor
+        codes[max(r - marker, 0):r + marker + 1, max(c - marker, 0):c + marker + 1] = code
+
+    return PALETTE[codes]
@@ -0,0 +1,82 @@
+"""
+Rota sonuç önbelleği.
+
+Anahtar: (grid parmak izi, start, goal, algoritma, parametreler). Grid
+içeriği değişince parmak izi de değiştiğinden eski kayıtlar bir daha
+eşleşmez ve LRU ile zamanla düşer. En fazla maxsize kayıt tutulur.
+
+    cache = RouteCache()
+    result, hit = cache.fetch(gm.grid, gm.start, gm.goal, "astar",
+                              lambda: run_planner("astar", ...),
+                              {"heuristic": "manhattan"})
+    cache.hits, cache.misses
+"""
+
+from collections import OrderedDict
+
+from grid import grid_fingerprint
+
+
+class RouteCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = int(maxsize)
+        self._routes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._routes)
+
+    @staticmethod
+    def make_key(fingerprint, start, goal, algo, params=None):
+        params = tuple(sorted((params or {}).items()))
+        return (fingerprint, tuple(start), tuple(goal), algo, params)
+
+    def get(self, key):
+        """Kayıt varsa sonucu (ve LRU sırasını tazeler), yoksa None."""
+        result = self._routes.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._routes.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        self._routes[key] = result
+        self._routes.move_to_end(key)
+        if len(self._routes) > self.maxsize:
+            self._routes.popitem(last=False)
+
+    def fetch(self, grid, start, goal, algo, compute, params=None, fingerprint=None):
+        """
+        Önbellekte varsa sonucu döner, yoksa compute() çağırıp saklar.
+        fingerprint verilirse grid yeniden özetlenmez.
+
+        Returns: result, hit
+        """
+        key = self.make_key(fingerprint or grid_fingerprint(grid),
+                            start, goal, algo, params)
+        result = self.get(key)
+        if result is not None:
+            return result, True
+
+        result = compute()
+        self.put(key, result)
+        return result, False
+
+    def invalidate(self, fingerprint):
+        """fingerprint'e ait tüm kayıtları siler; silinen kayıt sayısını döner."""
+        stale = [key for key in self._routes if key[0] == fingerprint]
+        for key in stale:
+            del self._routes[key]
+        return len(stale)
+
+    def clear(self):
+        self._routes.clear()
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._routes), "maxsize": self.maxsize}
@@ -0,0 +1,297 @@
+"""
+Adım adım (streaming) arama API'si.
+
+Planlayıcılar sonuna kadar çalışıp döndüğü için arayüzler arama sürerken
+hiçbir şey gösteremiyor. Buradaki generator'lar aramayı batch_size
+genişletmelik parçalar halinde ilerletir ve her parçada bir Step verir:
+
+    step.expanded   : bu batch'te genişletilen hücreler, (k, 2) int32
+    step.frontier   : bu batch'te open listesine eklenen hücreler, (m, 2) int32
+    step.total_expanded, step.open_size
+
+Generator bittiğinde dönüş değeri (StopIteration.value) diğer
+planlayıcılarla aynı sonuç tuple'ıdır: path, cost, expanded, runtime,
+visited. runtime yalnızca generator'ın çalıştığı süredir (tüketicinin
+beklettiği süre dahil değil).
+
+SteppedSearch bu generator'ı duraklatma / devam / iptal ile sarar.
+Hiç adım atılmadan run() çağrılırsa doğrudan planner.run_planner
+çalışır; tek seferde tüketmenin ek maliyeti yoktur.
+
+    search = SteppedSearch("astar", gm.grid, gm.start, gm.goal, batch_size=500)
+    for step in search:
+        draw(step.expanded)
+    path, cost, expanded, runtime, visited = search.result
+"""
+
+import heapq
+import threading
+import time
+from array import array
+
+import numpy as np
+
+from flat_search import INF, as_flat, check_trace, _extract_path, _make_heuristic, _trace_result
+from planner import run_planner
+from dp_path import INF as DP_INF, _dp_sweeps, _dp_table, _extract_dp_path
+
+STREAM_ALGOS = ("dijkstra", "astar", "dp")
+
+_EMPTY = np.empty((0, 2), dtype=np.int32)
+
+
+class Step:
+    def __init__(self, expanded, frontier, total_expanded, open_size):
+        self.expanded = expanded
+        self.frontier = frontier
+        self.total_expanded = total_expanded
+        self.open_size = open_size
+
+
+def _best_first_steps(fg, s, g, h, weights, batch_size, trace):
+    """Dijkstra (h None) / A* (h verilmiş) için adım adım arama."""
+    t_resume = time.perf_counter()
+    elapsed = 0.0
+
+    blocked = fg.blocked
+    offsets = fg.offsets
+
+    dist = array("i", [INF]) * fg.size
+    prev = array("i", [-1]) * fg.size
+    closed = bytearray(fg.size)
+    expanded = 0
+    order = array("i") if trace == "order" else None
+
+    dist[s] = 0
+    pq = [(h(s) if h is not None else 0, 0, s)]
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    batch = array("i")
+    frontier = array("i", [s])
+
+    while pq:
+        _, cost, u = pop(pq)
+        if closed[u]:
+            continue
+
+        closed[u] = 1
+        expanded += 1
+        batch.append(u)
+
+        if u == g:
+            break
+
+        for off in offsets:
+            v = u + off
+            if blocked[v]:
+                continue
+            new_cost = cost + (1 if weights is None else weights[v])
+            if new_cost < dist[v]:
+                dist[v] = new_cost
+                prev[v] = u
+                push(pq, (new_cost + h(v) if h is not None else new_cost, new_cost, v))
+                frontier.append(v)
+
+        if len(batch) >= batch_size:
+            if order is not None:
+                order.extend(batch)
+            step = Step(fg.cell_array(batch), fg.cell_array(frontier), expanded, len(pq))
+            batch, frontier = array("i"), array("i")
+
+            elapsed += time.perf_counter() - t_resume
+            yield step
+            t_resume = time.perf_counter()
+
+    if batch:
+        if order is not None:
+            order.extend(batch)
+        step = Step(fg.cell_array(batch), fg.cell_array(frontier), expanded, len(pq))
+        elapsed += time.perf_counter() - t_resume
+        yield step
+        t_resume = time.perf_counter()
+
+    path = []
+    cost = None
+    if dist[g] < INF:
+        path = _extract_path(fg, prev, s, g)
+        cost = dist[g]
+    visited = _trace_result(fg, trace, closed, order)
+
+    elapsed += time.perf_counter() - t_resume
+    return path, cost, expanded, elapsed, visited
+
+
+def _dp_steps(grid, start, goal, batch_size, trace):
+    """
+    dp_path.dp_shortest_path'in adım adım sürümü (aynı _dp_sweeps): her
+    iterasyonda iyileşen hücreler genişletilmiş sayılır, en az batch_size
+    hücre biriktiğinde verilir. frontier her zaman boştur.
+    """
+    t_resume = time.perf_counter()
+    elapsed = 0.0
+
+    dp, neighbors, free = _dp_table(np.asarray(grid), start)
+
+    expanded = 0
+    pending, pending_count = [], 0
+    order = []
+
+    for improved in _dp_sweeps(dp, neighbors, free, max(int(free.sum()), 1)):
+        cells = np.argwhere(improved).astype(np.int32)
+        expanded += len(cells)
+        pending.append(cells)
+        pending_count += len(cells)
+
+        if pending_count >= batch_size:
+            chunk = np.concatenate(pending)
+            order.append(chunk)
+            pending, pending_count = [], 0
+
+            elapsed += time.perf_counter() - t_resume
+            yield Step(chunk, _EMPTY, expanded, 0)
+            t_resume = time.perf_counter()
+
+    if pending:
+        chunk = np.concatenate(pending)
+        order.append(chunk)
+        elapsed += time.perf_counter() - t_resume
+        yield Step(chunk, _EMPTY, expanded, 0)
+        t_resume = time.perf_counter()
+
+    cells = np.concatenate(order) if order else _EMPTY
+    if trace == "visited":
+        visited = [tuple(c) for c in cells.tolist()]
+    elif trace == "order":
+        visited = cells
+    elif trace == "counts":
+        visited = expanded
+    else:
+        visited = None
+
+    path, cost = None, None
+    if dp[goal] < DP_INF:
+        path = _extract_dp_path(dp, neighbors, start, goal)
+        cost = None if path is None else dp[goal]
+
+    elapsed += time.perf_counter() - t_resume
+    return path, cost, expanded, elapsed, visited
+
+
+def search_steps(algo, grid, start, goal, heuristic="manhattan", cost_grid=None,
+                 landmarks=None, batch_size=256, trace="visited"):
+    """
+    algo: STREAM_ALGOS
+    batch_size: Step başına genişletme sayısı (en az 1)
+
+    Step üreten generator; dönüş değeri path, cost, expanded, runtime, visited
+    """
+    if algo not in STREAM_ALGOS:
+        raise ValueError(f"Unknown algorithm: {algo}")
+    if cost_grid is not None and algo != "dijkstra":
+        raise ValueError(f"{algo} only supports unit costs")
+    check_trace(trace)
+    batch_size = max(int(batch_size), 1)
+
+    if algo == "dp":
+        return _dp_steps(grid, start, goal, batch_size, trace)
+
+    fg = as_flat(grid)
+    h = _make_heuristic(fg, goal, heuristic, landmarks) if algo == "astar" else None
+    weights = None if cost_grid is None else fg.pad_values(cost_grid, 0)
+    return _best_first_steps(fg, fg.index(start), fg.index(goal), h, weights,
+                             batch_size, trace)
+
+
+class SteppedSearch:
+    """
+    search_steps üzerine duraklatma / devam / iptal.
+
+    pause / resume / cancel başka bir thread'den çağrılabilir; step()
+    yalnızca aramayı yürüten thread'den çağrılmalı.
+    """
+    def __init__(self, algo, grid, start, goal, batch_size=256, **params):
+        self.algo = algo
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.batch_size = batch_size
+        self.params = params
+
+        self._gen = None
+        self._running = threading.Event()
+        self._running.set()
+
+        self.cancelled = False
+        self.done = False
+        self.result = None
+        self.total_expanded = 0
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self._running.set()  # duraklatılmış step(wait=True) uyansın
+
+    def step(self, wait=False):
+        """
+        Bir sonraki Step. Duraklatılmışsa None döner (wait=True ise devam
+        ettirilene kadar bekler); arama bittiyse ya da iptal edildiyse None
+        döner ve done True olur.
+        """
+        if self.done:
+            return None
+        if self.paused:
+            if not wait:
+                return None
+            self._running.wait()
+
+        if self.cancelled:
+            if self._gen is not None:
+                self._gen.close()
+            self.done = True
+            return None
+
+        if self._gen is None:
+            self._gen = search_steps(self.algo, self.grid, self.start, self.goal,
+                                     batch_size=self.batch_size, **self.params)
+        try:
+            step = next(self._gen)
+        except StopIteration as stop:
+            self.result = stop.value
+            self.done = True
+            return None
+
+        self.total_expanded = step.total_expanded
+        return step
+
+    def __iter__(self):
+        while True:
+            step = self.step(wait=True)
+            if step is None:
+                return
+            yield step
+
+    def run(self):
+        """
+        Kalan aramayı bitirip sonucu döner (iptal edildiyse None).
+        Hiç adım atılmadıysa doğrudan run_planner kullanılır.
+        """
+        if self._gen is None and not self.done and not self.cancelled:
+            self.result = run_planner(self.algo, self.grid, self.start, self.goal,
+                                      **self.params)
+            self.total_expanded = self.result[2]
+            self.done = True
+            return self.result
+
+        for _ in self:
+            pass
+        return self.result
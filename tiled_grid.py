@@ -0,0 +1,422 @@
+"""
+Parça parça (tiled), tembel üretilen grid.
+
+GridMap.generate tüm n x n matrisi tek rng.random((n, n)) çağrısıyla
+çizer; harita boyutu RAM ile sınırlı kalır. TiledGrid haritayı
+tile_size x tile_size parçalara böler; her parça ilk erişimde
+(seed, tr, tc)'den türetilen bağımsız bir RNG ile üretilir. Aynı
+(seed, tr, tc) her zaman aynı parçayı verir: üretim sırası, süreç ya da
+önbellekten atılıp yeniden üretilmesi sonucu değiştirmez.
+
+Parçalar max_tiles kapasiteli bir LRU'da tutulur; değiştirilmiş
+(__setitem__) parçalar kaybolmasın diye önbellekten hiç atılmaz.
+
+    tg = TiledGrid(100_000, 0.2, seed=7, tile_size=512)
+    tg[r, c]                                  # tek hücre, yalnızca bir parça üretilir
+    run_planner("astar", tg, start, goal)     # tiled_search: parçalar üzerinden okur
+    tg.to_array(workers=4, packed=True)       # toplu üretim process pool'da
+
+Planlayıcılar:
+    run_planner astar / dijkstra (birim maliyet) -> tiled_search; bellek
+        yalnızca genişletilen bölge + önbellekteki parçalar kadar. ALT
+        sezgisi tüm harita boyutunda landmark tablosu istediğinden
+        heuristic="alt" normal motorla çalışır
+    DStarLite ve astar.astar grid[r, c] ile okuduğundan doğrudan çalışır
+    diğerleri np.asarray(tg) ile tüm haritayı açar (belleğe sığmalı)
+"""
+
+import hashlib
+import heapq
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from flat_search import check_trace
+from instrument import lazy_heap_counts
+
+
+def make_tile(n, obstacle_ratio, seed, tile_size, tr, tc):
+    """
+    (tr, tc) parçası: (h, w) uint8, 1 engel. Modül seviyesinde olduğundan
+    process pool'a verilebilir. GridMap gibi start / goal ve 4-komşuları boş.
+    """
+    r0, c0 = tr * tile_size, tc * tile_size
+    h = min(tile_size, n - r0)
+    w = min(tile_size, n - c0)
+    rng = np.random.default_rng((seed, tr, tc))
+    tile = (rng.random((h, w)) < obstacle_ratio).astype(np.uint8)
+
+    for (r, c) in [(0, 0), (n - 1, n - 1)]:
+        for dr, dc in [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]:
+            rr, cc = r + dr - r0, c + dc - c0
+            if 0 <= rr < h and 0 <= cc < w:
+                tile[rr, cc] = 0
+    return tile
+
+
+def _make_tile_job(args):
+    return make_tile(*args)
+
+
+def _span(key, n):
+    """int ya da adımsız dilim -> [start, stop) aralığı; diğerleri None."""
+    if isinstance(key, (int, np.integer)):
+        key = int(key) + n if key < 0 else int(key)
+        if not 0 <= key < n:
+            raise IndexError(f"index {key} out of bounds for size {n}")
+        return key, key + 1
+    if isinstance(key, slice) and key.step in (None, 1):
+        start, stop, _ = key.indices(n)
+        return start, max(stop, start)
+    return None
+
+
+class TiledGrid:
+    """
+    (n, n) uint8 grid gibi davranan tembel harita: shape, tg[r, c],
+    tg[r0:r1, c0:c1], tg[r, c] = v ve np.asarray(tg).
+    """
+    def __init__(self, n, obstacle_ratio, seed=42, tile_size=256, max_tiles=64):
+        self.n = int(n)
+        self.obstacle_ratio = float(obstacle_ratio)
+        self.seed = int(seed)
+        self.tile_size = int(tile_size)
+        self.max_tiles = max(int(max_tiles), 1)
+
+        self.shape = (self.n, self.n)
+        self.ndim = 2
+        self.dtype = np.dtype(np.uint8)
+        nt = math.ceil(self.n / self.tile_size)
+        self.tiles_shape = (nt, nt)
+
+        self._tiles = OrderedDict()  # (tr, tc) -> tile, LRU sırasıyla
+        self._dirty = {}             # değiştirilmiş parçalar (atılmaz)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def size(self):
+        return self.n * self.n
+
+    @property
+    def nbytes(self):
+        """Bellekteki parçaların toplam boyutu."""
+        return (sum(t.nbytes for t in self._tiles.values())
+                + sum(t.nbytes for t in self._dirty.values()))
+
+    def _args(self, tr, tc):
+        return (self.n, self.obstacle_ratio, self.seed, self.tile_size, tr, tc)
+
+    def tile(self, tr, tc):
+        """(tr, tc) parçası; yoksa üretilir (LRU)."""
+        key = (tr, tc)
+        tile = self._dirty.get(key)
+        if tile is not None:
+            self.hits += 1
+            return tile
+
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self.hits += 1
+            self._tiles.move_to_end(key)
+            return tile
+
+        self.misses += 1
+        tile = make_tile(*self._args(tr, tc))
+        self._put(key, tile)
+        return tile
+
+    def _put(self, key, tile):
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+
+    def clear(self):
+        """Değiştirilmemiş parçaları önbellekten atar."""
+        self._tiles.clear()
+
+    def fingerprint(self):
+        """
+        grid.grid_fingerprint karşılığı, haritayı açmadan: üretim
+        parametreleri + değiştirilmiş parçaların içeriği. Aynı içerikli
+        bir numpy grid'in özetiyle eşleşmez.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr(("tiled", self.n, self.obstacle_ratio, self.seed, self.tile_size)).encode())
+        for key in sorted(self._dirty):
+            h.update(repr(key).encode())
+            h.update(self._dirty[key].data)
+        return h.hexdigest()
+
+    # ------------------------
+    # ARRAY ARAYÜZÜ
+    # ------------------------
+
+    def _check(self, r, c):
+        r = r + self.n if r < 0 else r
+        c = c + self.n if c < 0 else c
+        if not (0 <= r < self.n and 0 <= c < self.n):
+            raise IndexError(f"cell {(r, c)} out of bounds for shape {self.shape}")
+        return r, c
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        r, c = key
+        if isinstance(r, (int, np.integer)) and isinstance(c, (int, np.integer)):
+            r, c = self._check(int(r), int(c))
+            T = self.tile_size
+            return int(self.tile(r // T, c // T)[r % T, c % T])
+
+        rows, cols = _span(r, self.n), _span(c, self.n)
+        if rows is None or cols is None:
+            return np.asarray(self)[key]  # adımlı dilimler vb.: tüm harita
+
+        block = self.region(rows[0], cols[0], rows[1], cols[1])
+        if not isinstance(r, slice):
+            block = block[0]
+        elif not isinstance(c, slice):
+            block = block[:, 0]
+        return block
+
+    def __setitem__(self, key, value):
+        r, c = self._check(*(int(v) for v in key))
+        T = self.tile_size
+        k = (r // T, c // T)
+        tile = self._dirty.get(k)
+        if tile is None:
+            tile = self.tile(*k).copy()
+            self._tiles.pop(k, None)
+            self._dirty[k] = tile
+        tile[r % T, c % T] = 1 if value else 0
+
+    def region(self, r0, c0, r1, c1):
+        """[r0, r1) x [c0, c1) bölgesinin (r1-r0, c1-c0) uint8 kopyası."""
+        T = self.tile_size
+        out = np.empty((max(r1 - r0, 0), max(c1 - c0, 0)), dtype=np.uint8)
+        if out.size == 0:
+            return out
+        for tr in range(r0 // T, (r1 - 1) // T + 1):
+            for tc in range(c0 // T, (c1 - 1) // T + 1):
+                tile = self.tile(tr, tc)
+                ar0, ac0 = max(r0, tr * T), max(c0, tc * T)
+                ar1, ac1 = min(r1, tr * T + tile.shape[0]), min(c1, tc * T + tile.shape[1])
+                out[ar0 - r0:ar1 - r0, ac0 - c0:ac1 - c0] = \
+                    tile[ar0 - tr * T:ar1 - tr * T, ac0 - tc * T:ac1 - tc * T]
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        grid = self.to_array()
+        return grid if dtype is None else grid.astype(dtype, copy=False)
+
+    def __eq__(self, other):
+        return np.asarray(self) == other
+
+    def __ne__(self, other):
+        return np.asarray(self) != other
+
+    __hash__ = None
+
+    # ------------------------
+    # TOPLU ÜRETİM
+    # ------------------------
+
+    def _generate(self, keys, workers):
+        """keys sırasıyla (key, tile) üretir; önbellekte / değiştirilmiş olanlar yeniden üretilmez."""
+        missing = [k for k in keys if k not in self._dirty and k not in self._tiles]
+        if workers is None or workers <= 1 or len(missing) <= 1:
+            for k in keys:
+                yield k, self.tile(*k)
+            return
+
+        pending = set(missing)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(missing) // (workers * 4))
+            # map sonuçları missing sırasıyla gelir, missing de keys sırasında
+            tiles = pool.map(_make_tile_job, [self._args(*k) for k in missing],
+                             chunksize=chunksize)
+            for k in keys:
+                if k not in pending:
+                    yield k, self.tile(*k)
+                    continue
+                tile = next(tiles)
+                self.misses += 1
+                self._put(k, tile)
+                yield k, tile
+
+    def prefetch(self, tiles, workers=None):
+        """tiles: [(tr, tc), ...]; eksik olanlar process pool'da üretilip önbelleğe alınır."""
+        for _ in self._generate(list(tiles), workers):
+            pass
+
+    def to_array(self, workers=None, packed=False):
+        """
+        Tüm haritayı üretir. workers > 1 ise parçalar process pool'da
+        üretilir. packed=True ise grid.PackedGrid döner; her parça satırı
+        ayrı paketlendiğinden tam uint8 harita hiç bellekte tutulmaz.
+        """
+        nt = self.tiles_shape[1]
+        T = self.tile_size
+        keys = [(tr, tc) for tr in range(self.tiles_shape[0]) for tc in range(nt)]
+
+        if packed:
+            from grid import PackedGrid
+            out = np.empty((self.n, (self.n + 7) // 8), dtype=np.uint8)
+        else:
+            out = np.empty(self.shape, dtype=np.uint8)
+
+        band = None
+        for (tr, tc), tile in self._generate(keys, workers):
+            r0, c0 = tr * T, tc * T
+            if not packed:
+                out[r0:r0 + tile.shape[0], c0:c0 + tile.shape[1]] = tile
+                continue
+            if tc == 0:
+                band = np.empty((tile.shape[0], self.n), dtype=np.uint8)
+            band[:, c0:c0 + tile.shape[1]] = tile
+            if tc == nt - 1:
+                out[r0:r0 + band.shape[0]] = np.packbits(band, axis=1)
+
+        return PackedGrid(out, self.n) if packed else out
+
+
+# ------------------------
+# TILE ÜZERİNDEN ARAMA
+# ------------------------
+
+def tiled_search(tg, start, goal, heuristic=None, stats=None, trace="visited"):
+    """
+    TiledGrid üzerinde birim maliyetli en iyi öncelikli arama
+    (heuristic None -> Dijkstra, "manhattan" / "euclidean" / "chebyshev" -> A*).
+
+    Durum sözlüklerde tutulur; bellek genişletilen bölge ile sınırlıdır.
+    Engel bilgisi parça parça okunur: aramanın dokunduğu parçalar bytes
+    olarak yerel bir sözlükte tutulur (LRU'ya her komşuda gidilmez).
+
+    Returns: path, cost, expanded, runtime, visited
+    """
+    t0 = time.perf_counter()
+    order = check_trace(trace)
+
+    n = tg.n
+    T = tg.tile_size
+    gr, gc = goal
+    if heuristic is None:
+        def h(r, c):
+            return 0
+    elif heuristic == "euclidean":
+        def h(r, c):
+            return math.sqrt((r - gr) ** 2 + (c - gc) ** 2)
+    elif heuristic == "chebyshev":
+        def h(r, c):
+            return max(abs(r - gr), abs(c - gc))
+    elif heuristic == "manhattan":
+        def h(r, c):
+            return abs(r - gr) + abs(c - gc)
+    else:
+        raise ValueError(f"Unsupported heuristic for tiled grids: {heuristic}")
+
+    # (tr, tc) -> (bytes, genişlik); tg'nin LRU'su gibi en fazla max_tiles parça.
+    # Ardışık okumalar çoğunlukla aynı parçaya düştüğünden son parça ayrıca tutulur
+    local = OrderedDict()
+    limit = tg.max_tiles
+    touch = local.move_to_end
+    last_key, last_data, last_w = None, b"", 0
+
+    def blocked(r, c):
+        nonlocal last_key, last_data, last_w
+        key = (r // T, c // T)
+        if key != last_key:
+            entry = local.get(key)
+            if entry is None:
+                tile = tg.tile(*key)
+                entry = local[key] = (tile.tobytes(), tile.shape[1])
+                if len(local) > limit:
+                    local.popitem(last=False)
+            else:
+                touch(key)
+            last_key = key
+            last_data, last_w = entry
+        return last_data[(r % T) * last_w + c % T]
+
+    g = {start: 0}
+    prev = {}
+    closed = set()
+    expanded = 0
+    record = order.extend if order is not None else None
+
+    pq = [(h(*start), 0, start)]
+    push = heapq.heappush
+    pop = heapq.heappop
+    pushes = peak = 1
+    instrumented = stats is not None
+    on_expand = stats.on_expand if instrumented else None
+
+    if blocked(*start) or blocked(*goal):
+        pq = []
+
+    while pq:
+        _, cost, u = pop(pq)
+        if u in closed:
+            continue
+
+        closed.add(u)
+        expanded += 1
+        if record is not None:
+            record(u)
+        if on_expand is not None:
+            on_expand(u)
+
+        if u == goal:
+            break
+
+        r, c = u
+        tentative = cost + 1
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if 0 <= nr < n and 0 <= nc < n and not blocked(nr, nc):
+                v = (nr, nc)
+                if tentative < g.get(v, tentative + 1):
+                    g[v] = tentative
+                    prev[v] = u
+                    push(pq, (tentative + h(nr, nc), tentative, v))
+                    pushes += 1
+
+        if instrumented and len(pq) > peak:
+            peak = len(pq)
+
+    t_search = time.perf_counter()
+
+    path = []
+    cost = None
+    if goal in closed:
+        cost = g[goal]
+        cur = goal
+        while cur != start:
+            path.append(cur)
+            cur = prev[cur]
+        path.append(start)
+        path.reverse()
+
+    if trace == "visited":
+        visited = closed
+    elif trace == "counts":
+        visited = expanded
+    elif trace == "order":
+        visited = (np.frombuffer(order, dtype=np.int32).reshape(-1, 2).copy()
+                   if order else np.empty((0, 2), dtype=np.int32))
+    else:
+        visited = None
+
+    runtime = time.perf_counter() - t0
+    if stats is not None:
+        stats.record(**lazy_heap_counts(pushes, len(pq), expanded, peak))
+        stats.add_time("search", t_search - t0)
+        stats.add_time("extract", runtime - (t_search - t0))
+    return path, cost, expanded, runtime, visited